@@ -11,7 +11,7 @@ ADD COLUMN IF NOT EXISTS discord_approver TEXT;
 ALTER TABLE linkedin_drafts 
 ADD COLUMN IF NOT EXISTS industry TEXT,
 ADD COLUMN IF NOT EXISTS audience TEXT,
-ADD COLUMN IF NOT EXISTS golden_threads TEXT;
+ADD COLUMN IF NOT EXISTS golden_threads JSONB;
 
 -- Add error tracking columns
 ALTER TABLE linkedin_drafts 
@@ -42,7 +42,7 @@ COMMENT ON COLUMN linkedin_drafts.discord_channel_id IS 'Discord channel ID wher
 COMMENT ON COLUMN linkedin_drafts.discord_approver IS 'Discord username of person who approved/declined';
 COMMENT ON COLUMN linkedin_drafts.industry IS 'Industry/topic category for content';
 COMMENT ON COLUMN linkedin_drafts.audience IS 'Target audience for the post';
-COMMENT ON COLUMN linkedin_drafts.golden_threads IS 'Selected content themes (JSON)';
+COMMENT ON COLUMN linkedin_drafts.golden_threads IS 'Selected content themes (JSONB)';
 COMMENT ON COLUMN linkedin_drafts.last_error IS 'Last error message if publishing failed';
 COMMENT ON COLUMN linkedin_drafts.retry_count IS 'Number of retry attempts for failed posts';
 
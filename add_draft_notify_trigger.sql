@@ -0,0 +1,22 @@
+-- Notify the Discord bot when linkedin_drafts rows change status
+-- Run this so db_monitor can react via LISTEN/NOTIFY instead of waiting for the next poll
+
+CREATE OR REPLACE FUNCTION notify_linkedin_draft_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify(
+        'linkedin_draft_changes',
+        json_build_object('id', NEW.draft_id, 'status', NEW.status)::text
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Fire on new drafts and on status transitions (pending -> approved_for_socials, etc.)
+DROP TRIGGER IF EXISTS linkedin_draft_changes_trigger ON linkedin_drafts;
+CREATE TRIGGER linkedin_draft_changes_trigger
+    AFTER INSERT OR UPDATE OF status ON linkedin_drafts
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_linkedin_draft_change();
+
+COMMENT ON FUNCTION notify_linkedin_draft_change() IS 'Publishes {id, status} on the linkedin_draft_changes channel for db_monitor';
@@ -0,0 +1,16 @@
+-- Partial indexes for the db_monitor poll queries on linkedin_drafts
+-- CONCURRENTLY avoids blocking writes while building; run outside a transaction (plain psql is fine)
+
+-- get_pending_posts: status = 'pending' AND discord_message_id IS NULL
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drafts_pending
+    ON linkedin_drafts (status)
+    WHERE status = 'pending' AND discord_message_id IS NULL;
+
+-- get_approved_posts: status = 'approved_for_socials' AND linkedin_post_id IS NULL
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drafts_approved
+    ON linkedin_drafts (status)
+    WHERE status = 'approved_for_socials' AND linkedin_post_id IS NULL;
+
+-- Ordering by creation time
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drafts_created_at
+    ON linkedin_drafts (created_at);
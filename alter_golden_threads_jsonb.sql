@@ -0,0 +1,17 @@
+-- Store linkedin_drafts.golden_threads as JSONB so Postgres parses and indexes it natively
+-- Existing values that are not valid JSON are kept as JSON strings
+
+ALTER TABLE linkedin_drafts
+ALTER COLUMN golden_threads TYPE JSONB
+USING CASE
+    WHEN golden_threads IS NULL OR btrim(golden_threads) = '' THEN NULL
+    WHEN left(btrim(golden_threads), 1) IN ('[', '{', '"') THEN golden_threads::jsonb
+    ELSE to_jsonb(golden_threads)
+END;
+
+-- Containment lookups like golden_threads @> '["leadership"]'
+-- CONCURRENTLY avoids blocking writes while building; run outside a transaction (plain psql is fine)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drafts_threads
+    ON linkedin_drafts USING gin (golden_threads jsonb_path_ops);
+
+COMMENT ON COLUMN linkedin_drafts.golden_threads IS 'Selected content themes (JSONB)';
@@ -1,54 +1,100 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import FrozenSet, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-class Config:
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Environment configuration, read once at import time"""
+
     # Discord Configuration
-    DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
-    DISCORD_GUILD_ID = os.getenv('DISCORD_GUILD_ID')
-    DISCORD_APPROVAL_CHANNEL_ID = int(os.getenv('DISCORD_APPROVAL_CHANNEL_ID', 0))
-    DISCORD_NOTIFICATION_CHANNEL_ID = int(os.getenv('DISCORD_NOTIFICATION_CHANNEL_ID', 0))
-    
+    DISCORD_TOKEN: Optional[str]
+    DISCORD_GUILD_ID: Optional[str]
+    DISCORD_APPROVAL_CHANNEL_ID: int
+    DISCORD_NOTIFICATION_CHANNEL_ID: int
+
     # Database Configuration
-    DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://sasreliability@localhost/sas_social')
-    DB_HOST = os.getenv('DB_HOST', 'localhost')
-    DB_PORT = os.getenv('DB_PORT', '5432')
-    DB_NAME = os.getenv('DB_NAME', 'sas_social')
-    DB_USER = os.getenv('DB_USER', 'sasreliability')
-    DB_PASSWORD = os.getenv('DB_PASSWORD', '')
-    
+    DATABASE_URL: str
+    DB_HOST: str
+    DB_PORT: str
+    DB_NAME: str
+    DB_USER: str
+    DB_PASSWORD: str
+
     # LinkedIn Configuration
-    LINKEDIN_CLIENT_ID = os.getenv('LINKEDIN_CLIENT_ID')
-    LINKEDIN_CLIENT_SECRET = os.getenv('LINKEDIN_CLIENT_SECRET')
-    LINKEDIN_ACCESS_TOKEN = os.getenv('LINKEDIN_ACCESS_TOKEN')
-    LINKEDIN_PERSON_ID = os.getenv('LINKEDIN_PERSON_ID')
-    
+    LINKEDIN_CLIENT_ID: Optional[str]
+    LINKEDIN_CLIENT_SECRET: Optional[str]
+    LINKEDIN_ACCESS_TOKEN: Optional[str]
+    LINKEDIN_PERSON_ID: Optional[str]
+
     # Webhook Configuration (for n8n integration)
-    N8N_WEBHOOK_URL = os.getenv('N8N_WEBHOOK_URL')
-    
+    N8N_WEBHOOK_URL: Optional[str]
+
     # Monitoring Configuration
-    POLL_INTERVAL = int(os.getenv('POLL_INTERVAL', '30'))  # seconds
-    
+    POLL_INTERVAL: int  # seconds
+
     # Bot Configuration
-    BOT_PREFIX = os.getenv('BOT_PREFIX', '!')
-    ADMIN_USER_IDS = [int(id.strip()) for id in os.getenv('ADMIN_USER_IDS', '').split(',') if id.strip()]
-    
-    @classmethod
-    def validate(cls):
+    BOT_PREFIX: str
+    ADMIN_USER_IDS: FrozenSet[int]
+
+    def validate(self):
         """Validate required configuration"""
         required_vars = [
             'DISCORD_TOKEN',
             'DISCORD_APPROVAL_CHANNEL_ID',
             'DATABASE_URL'
         ]
-        
-        missing = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing.append(var)
-        
+
+        values = attrgetter(*required_vars)(self)
+        missing = [var for var, value in zip(required_vars, values) if not value]
+
         if missing:
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
-        
-        return True
\ No newline at end of file
+
+        return True
+
+@lru_cache(maxsize=1)
+def _admin_ids() -> FrozenSet[int]:
+    """Parse ADMIN_USER_IDS once into a set for O(1) permission checks"""
+    ids = set()
+    for raw_id in os.getenv('ADMIN_USER_IDS', '').split(','):
+        raw_id = raw_id.strip()
+        if not raw_id:
+            continue
+        if not raw_id.isdigit():
+            raise ValueError(f"Invalid Discord user ID in ADMIN_USER_IDS: {raw_id!r}")
+        ids.add(int(raw_id))
+    return frozenset(ids)
+
+@lru_cache(maxsize=1)
+def _load_config() -> EnvConfig:
+    """Read and parse all environment variables exactly once"""
+    return EnvConfig(
+        DISCORD_TOKEN=os.getenv('DISCORD_TOKEN'),
+        DISCORD_GUILD_ID=os.getenv('DISCORD_GUILD_ID'),
+        DISCORD_APPROVAL_CHANNEL_ID=int(os.getenv('DISCORD_APPROVAL_CHANNEL_ID', 0)),
+        DISCORD_NOTIFICATION_CHANNEL_ID=int(os.getenv('DISCORD_NOTIFICATION_CHANNEL_ID', 0)),
+        DATABASE_URL=os.getenv('DATABASE_URL', 'postgresql://sasreliability@localhost/sas_social'),
+        DB_HOST=os.getenv('DB_HOST', 'localhost'),
+        DB_PORT=os.getenv('DB_PORT', '5432'),
+        DB_NAME=os.getenv('DB_NAME', 'sas_social'),
+        DB_USER=os.getenv('DB_USER', 'sasreliability'),
+        DB_PASSWORD=os.getenv('DB_PASSWORD', ''),
+        LINKEDIN_CLIENT_ID=os.getenv('LINKEDIN_CLIENT_ID'),
+        LINKEDIN_CLIENT_SECRET=os.getenv('LINKEDIN_CLIENT_SECRET'),
+        LINKEDIN_ACCESS_TOKEN=os.getenv('LINKEDIN_ACCESS_TOKEN'),
+        LINKEDIN_PERSON_ID=os.getenv('LINKEDIN_PERSON_ID'),
+        N8N_WEBHOOK_URL=os.getenv('N8N_WEBHOOK_URL'),
+        POLL_INTERVAL=int(os.getenv('POLL_INTERVAL', '30')),
+        BOT_PREFIX=os.getenv('BOT_PREFIX', '!'),
+        ADMIN_USER_IDS=_admin_ids(),
+    )
+
+CONFIG = _load_config()
+
+# Existing modules import `Config`; keep the name pointing at the singleton
+Config = CONFIG
@@ -1,69 +1,201 @@
 import asyncio
+import bisect
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import List, NamedTuple
 from models import db, LinkedInDraft, PostStatus
-from config import Config
+from config import CONFIG
+from db_pool import asyncpg_dsn
 from enhanced_logging import get_enhanced_logger
 
+try:
+    import asyncpg
+except ImportError:
+    # Fallback to timer-driven polling if asyncpg is not available
+    asyncpg = None
+
 logger = get_enhanced_logger(__name__)
 
+# Outbox between DB polling and Discord/LinkedIn calls
+OUTBOX_SIZE = 64  # Polling blocks once this many posts are waiting
+DISPATCH_WORKERS = 8  # Upper bound on concurrent Discord/LinkedIn calls
+
+# LISTEN/NOTIFY settings (see add_draft_notify_trigger.sql)
+NOTIFY_CHANNEL = 'linkedin_draft_changes'
+SAFETY_POLL_INTERVAL = 300  # seconds between polls while listening
+NOTIFY_COALESCE_WINDOW = 0.01  # seconds to gather bursts of notifications
+
+_HASHTAG_RE = re.compile(r'#\w+')
+_MENTION_RE = re.compile(r'@\w+')
+_PERSONAL_RE = re.compile(r'\b(?:i|my|me|personally|experience)\b', re.IGNORECASE)
+
+_WORD_RE = re.compile(r'\S+')
+_MAX_COUNTED_WORDS = 151  # Word counts only matter up to the 150-word ceiling
+
+_ENGAGEMENT_THRESHOLDS = (15, 25)
+_ENGAGEMENT_LEVELS = ("Low", "Medium", "High")
+
+# Single-pass scanner for hashtags, mentions and questions. Profanity and personal-story
+# words are matched separately: as alternatives here, #\w+/@\w+ would consume them first
+_POST_SCAN_RE = re.compile(r'(#\w+)|(@\w+)|(\?)')
+_PROFANITY_RE = re.compile(r'\b(?:fuck|shit|damn)\b', re.IGNORECASE)  # Basic profanity check
+
+class ContentScan(NamedTuple):
+    """Result of scanning post content with scan_content"""
+    hashtags: List[str]
+    mentions: List[str]
+    profanity: List[str]
+    has_question: bool
+    has_personal: bool
+
 class DatabaseMonitor:
     def __init__(self, discord_bot=None):
         self.discord_bot = discord_bot
         self.running = False
+        self.outbox = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self._queued = set()  # (kind, draft_id) pairs waiting in or taken from the outbox
+        self._changed = asyncio.Event()
         
     async def start_monitoring(self):
         """Start monitoring the database for new pending posts"""
         self.running = True
-        logger.system_health('Database Monitor', 'healthy', {'poll_interval': f'{Config.POLL_INTERVAL}s'})
+        poll = CONFIG.POLL_INTERVAL
+        listener = await self._start_listener()
         
-        while self.running:
-            try:
-                await self.check_for_pending_posts()
-                await self.check_for_approved_posts()
-                await asyncio.sleep(Config.POLL_INTERVAL)
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(10)  # Wait before retrying
+        if listener:
+            logger.system_health('Database Monitor', 'healthy', {
+                'mode': 'listen/notify',
+                'safety_poll': f'{SAFETY_POLL_INTERVAL}s'
+            })
+        else:
+            logger.system_health('Database Monitor', 'healthy', {'poll_interval': f'{poll}s'})
+        
+        workers = [asyncio.create_task(self._dispatch_worker()) for _ in range(DISPATCH_WORKERS)]
+        
+        # Bind hot-loop lookups to locals once
+        poll_once = self.poll_once
+        wait_for_changes = self._wait_for_changes
+        log_error = logger.error
+        sleep = asyncio.sleep
+        
+        try:
+            while self.running:
+                try:
+                    await poll_once()
+                    listening = listener is not None and not listener.is_closed()
+                    await wait_for_changes(SAFETY_POLL_INTERVAL if listening else poll)
+                except Exception as e:
+                    log_error(f"Error in monitoring loop: {e}")
+                    await sleep(10)  # Wait before retrying
+        finally:
+            for worker in workers:
+                worker.cancel()
+            if listener is not None and not listener.is_closed():
+                await listener.close()
     
     def stop_monitoring(self):
         """Stop the monitoring loop"""
         self.running = False
+        self._changed.set()  # Wake the loop so it can exit
         logger.info("🔴 Stopping database monitoring...")
     
-    async def check_for_pending_posts(self):
+    async def _start_listener(self):
+        """Open a dedicated connection that LISTENs for draft changes"""
+        if asyncpg is None:
+            return None
+        
+        try:
+            connection = await asyncpg.connect(asyncpg_dsn(CONFIG.DATABASE_URL))
+            await connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+            return connection
+        except Exception as e:
+            logger.warning(f"LISTEN/NOTIFY unavailable, falling back to polling: {e}")
+            return None
+    
+    def _on_notify(self, connection, pid, channel, payload):
+        """asyncpg listener callback - wake the monitoring loop"""
+        self._changed.set()
+    
+    async def _wait_for_changes(self, timeout):
+        """Wait for a change notification or until timeout elapses"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return
+        
+        # Coalesce bursts of notifications into a single poll
+        await asyncio.sleep(NOTIFY_COALESCE_WINDOW)
+        self._changed.clear()
+    
+    async def poll_once(self):
+        """Fetch pending and approved posts in one query and dispatch both"""
+        # SQLAlchemy calls block, so keep them off the event loop
+        pending_posts, approved_posts = await asyncio.to_thread(db.get_pending_and_approved_posts)
+        await self.check_for_pending_posts(pending_posts)
+        await self.check_for_approved_posts(approved_posts)
+    
+    async def check_for_pending_posts(self, pending_posts=None):
         """Check for new pending posts and notify Discord"""
         try:
-            pending_posts = db.get_pending_posts()
+            if pending_posts is None:
+                pending_posts = await asyncio.to_thread(db.get_pending_posts)
             
             for post in pending_posts:
                 logger.post_activity('detected', f'post_{post.id}', 'pending approval')
                 
                 if self.discord_bot:
-                    # Send to Discord for approval
-                    await self.discord_bot.send_approval_request(post)
+                    # Queue for the dispatch workers to send to Discord for approval
+                    await self._enqueue('approval', post)
                 else:
                     logger.warning("Discord bot not available, skipping notification")
                     
         except Exception as e:
             logger.error(f"Error checking pending posts: {e}")
     
-    async def check_for_approved_posts(self):
+    async def check_for_approved_posts(self, approved_posts=None):
         """Check for approved posts ready for LinkedIn publishing"""
         try:
-            approved_posts = db.get_approved_posts()
+            if approved_posts is None:
+                approved_posts = await asyncio.to_thread(db.get_approved_posts)
             
             for post in approved_posts:
                 logger.post_activity('detected', f'post_{post.id}', 'ready for publishing')
                 
                 if self.discord_bot:
-                    # Trigger LinkedIn publishing
-                    await self.discord_bot.publish_to_linkedin(post)
+                    # Queue for the dispatch workers to trigger LinkedIn publishing
+                    await self._enqueue('publish', post)
                 else:
                     logger.warning("Discord bot not available, skipping publication")
                     
         except Exception as e:
             logger.error(f"Error checking approved posts: {e}")
+    
+    async def _enqueue(self, kind, post):
+        """Add a post to the outbox unless it is already queued or in flight"""
+        key = (kind, post.id)
+        if key in self._queued:
+            return
+        
+        self._queued.add(key)
+        await self.outbox.put((kind, post))  # Waits while the outbox is full
+    
+    async def _dispatch_worker(self):
+        """Drain the outbox, handing each post to the Discord bot"""
+        while True:
+            kind, post = await self.outbox.get()
+            try:
+                if kind == 'approval':
+                    await self.discord_bot.send_approval_request(post)
+                else:
+                    await self.discord_bot.publish_to_linkedin(post)
+            except Exception as e:
+                logger.error(f"Error dispatching post {post.id}: {e}")
+            finally:
+                self._queued.discard((kind, post.id))
+                self.outbox.task_done()
 
 class PostProcessor:
     """Utility class for processing posts"""
@@ -71,90 +203,124 @@ class PostProcessor:
     @staticmethod
     def create_linkedin_preview(post):
         """Create a preview of how the post will look on LinkedIn"""
-        content = post.content
+        # Cached on the fields the preview depends on, so re-rendered embeds skip the scan
+        preview = _cached_preview(
+            post.content,
+            bool(post.industry),
+            post.image_path,
+            bool(post.image_path or post.image_base64)
+        )
+        # The cached entry holds tuples; hand each caller its own lists
+        return {**preview, "hashtags": list(preview["hashtags"]), "mentions": list(preview["mentions"])}
+    
+    @staticmethod
+    def scan_content(content):
+        """Collect hashtags, mentions, profanity and engagement signals"""
+        hashtags = []
+        mentions = []
+        has_question = False
+        
+        for match in _POST_SCAN_RE.finditer(content):
+            group = match.lastindex
+            if group == 1:
+                hashtags.append(match.group(1))
+            elif group == 2:
+                mentions.append(match.group(2))
+            else:
+                has_question = True
         
-        # Truncate if too long for preview
-        if len(content) > 500:
-            content = content[:497] + "..."
+        # Same patterns as the standalone paths, so words inside #tags/@mentions count too
+        profanity = _PROFANITY_RE.findall(content)
+        has_personal = _PERSONAL_RE.search(content) is not None
         
-        return {
-            "content": content,
-            "has_image": bool(post.image_path or post.image_base64),
-            "image_url": post.image_path,
-            "character_count": len(post.content),
-            "estimated_engagement": PostProcessor.estimate_engagement(post),
-            "hashtags": PostProcessor.extract_hashtags(post.content),
-            "mentions": PostProcessor.extract_mentions(post.content)
-        }
+        return ContentScan(hashtags, mentions, profanity, has_question, has_personal)
     
     @staticmethod
-    def estimate_engagement(post):
+    def estimate_engagement(post, scan=None):
         """Simple heuristic to estimate potential engagement"""
-        content = post.content.lower()
-        
-        # Basic engagement factors
-        score = 0
-        
-        # Length factor (optimal LinkedIn posts are 1-3 sentences)
-        word_count = len(content.split())
-        if 20 <= word_count <= 150:
-            score += 10
-        
-        # Question factor
-        if '?' in content:
-            score += 5
-        
-        # Personal story factor
-        personal_indicators = ['i ', 'my ', 'me ', 'personally', 'experience']
-        if any(indicator in content for indicator in personal_indicators):
-            score += 8
-        
-        # Industry relevance
-        if post.industry:
-            score += 5
-        
-        # Image factor
-        if post.image_path or post.image_base64:
-            score += 7
-        
-        # Convert to engagement estimate
-        if score >= 25:
-            return "High"
-        elif score >= 15:
-            return "Medium"
+        content = post.content
+        if scan is None:
+            # Standalone call: stop at the first hit instead of a full scan
+            has_question = '?' in content
+            has_personal = _PERSONAL_RE.search(content) is not None
         else:
-            return "Low"
+            has_question = scan.has_question
+            has_personal = scan.has_personal
+        
+        return _engagement_level(
+            content, has_question, has_personal,
+            bool(post.industry), bool(post.image_path or post.image_base64)
+        )
     
     @staticmethod
     def extract_hashtags(content):
         """Extract hashtags from content"""
-        import re
-        return re.findall(r'#\w+', content)
+        return _HASHTAG_RE.findall(content)
     
     @staticmethod
     def extract_mentions(content):
         """Extract mentions from content"""
-        import re
-        return re.findall(r'@\w+', content)
+        return _MENTION_RE.findall(content)
     
     @staticmethod
     def validate_post_content(content):
         """Validate LinkedIn post content"""
         errors = []
         
-        if not content or not content.strip():
+        # isspace() avoids allocating a stripped copy; it is False for ""
+        if not content or content.isspace():
             errors.append("Content cannot be empty")
+            return errors
         
+        # Oversize content is rejected outright; skip scanning it for profanity
         if len(content) > 3000:
             errors.append("Content exceeds LinkedIn's 3000 character limit")
+            return errors
         
-        # Check for appropriate professional tone
-        inappropriate_words = ['fuck', 'shit', 'damn']  # Basic profanity check
-        for word in inappropriate_words:
-            if word.lower() in content.lower():
-                errors.append(f"Content contains inappropriate language: {word}")
+        # Check for appropriate professional tone (one error per distinct word)
+        profanity = PostProcessor.scan_content(content).profanity
+        for word in dict.fromkeys(m.lower() for m in profanity):
+            errors.append(f"Content contains inappropriate language: {word}")
         
         return errors
 
+def _engagement_level(content, has_question, has_personal, has_industry, has_image):
+    """Score engagement signals and bucket the result into Low/Medium/High"""
+    # Count words lazily, stopping once the post is past the length window
+    word_count = sum(1 for _ in islice(_WORD_RE.finditer(content), _MAX_COUNTED_WORDS))
+    
+    # Weighted sum of engagement factors (booleans count as 0/1)
+    score = (
+        10 * (20 <= word_count <= 150)  # Length (optimal LinkedIn posts are 1-3 sentences)
+        + 5 * has_question  # Question
+        + 8 * has_personal  # Personal story
+        + 5 * has_industry  # Industry relevance
+        + 7 * has_image  # Image
+    )
+    
+    # Convert to engagement estimate: <15 Low, 15-24 Medium, >=25 High
+    return _ENGAGEMENT_LEVELS[bisect.bisect_right(_ENGAGEMENT_THRESHOLDS, score)]
+
+@lru_cache(maxsize=512)
+def _cached_preview(content, has_industry, image_path, has_image):
+    """Build the LinkedIn preview dict for create_linkedin_preview"""
+    content_len = len(content)
+    scan = PostProcessor.scan_content(content)
+    
+    # Truncate if too long for preview
+    preview_content = f"{content[:497]}..." if content_len > 500 else content
+    
+    return {
+        "content": preview_content,
+        "has_image": has_image,
+        "image_url": image_path,
+        "character_count": content_len,
+        "estimated_engagement": _engagement_level(
+            content, scan.has_question, scan.has_personal, has_industry, has_image
+        ),
+        "hashtags": tuple(scan.hashtags),
+        "mentions": tuple(scan.mentions)
+    }
+
 # Global monitor instance
 monitor = DatabaseMonitor()
\ No newline at end of file
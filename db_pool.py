@@ -0,0 +1,128 @@
+import asyncio
+import json
+import uuid
+from sqlalchemy.dialects.postgresql import JSONB
+from config import CONFIG
+from models import db, LinkedInDraft, PostStatus
+from enhanced_logging import get_enhanced_logger
+
+try:
+    import asyncpg
+except ImportError:
+    # Fallback to the synchronous ORM in a worker thread if asyncpg is not available
+    asyncpg = None
+
+logger = get_enhanced_logger(__name__)
+
+# Pool sizing
+POOL_MIN_SIZE = 10
+POOL_MAX_SIZE = 50
+POOL_MAX_QUERIES = 50000  # Recycle a connection after this many queries
+POOL_MAX_IDLE = 300  # seconds before an idle connection is closed
+
+_DRAFT_COLUMNS = frozenset(LinkedInDraft.__table__.columns.keys())
+# asyncpg takes JSON text for jsonb parameters
+_DRAFT_JSONB_COLUMNS = frozenset(
+    column.key for column in LinkedInDraft.__table__.columns if isinstance(column.type, JSONB)
+)
+
+def asyncpg_dsn(url):
+    """asyncpg expects a plain postgresql:// DSN without a SQLAlchemy driver suffix"""
+    scheme, sep, rest = url.partition('://')
+    return scheme.split('+')[0] + sep + rest
+
+class AsyncDatabasePool:
+    """asyncpg connection pool for queries issued from Discord handlers"""
+
+    def __init__(self, dsn=None):
+        self.dsn = dsn or CONFIG.DATABASE_URL
+        self._pool = None
+
+    @property
+    def available(self):
+        return self._pool is not None
+
+    async def start(self):
+        """Open the pool; leave it unavailable (ORM fallback) if that fails"""
+        if asyncpg is None or self._pool is not None:
+            return
+
+        try:
+            self._pool = await asyncpg.create_pool(
+                asyncpg_dsn(self.dsn),
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_queries=POOL_MAX_QUERIES,
+                max_inactive_connection_lifetime=POOL_MAX_IDLE
+            )
+            logger.connection_status("Async DB Pool", True, f"{POOL_MIN_SIZE}-{POOL_MAX_SIZE} connections")
+        except Exception as e:
+            logger.warning(f"⚠️ Async DB pool unavailable, using ORM in worker threads: {e}")
+            self._pool = None
+
+    async def close(self):
+        """Close the pool if it was opened"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def fetchval(self, query, *args):
+        async with self._pool.acquire() as connection:
+            return await connection.fetchval(query, *args)
+
+    async def execute(self, query, *args):
+        async with self._pool.acquire() as connection:
+            return await connection.execute(query, *args)
+
+    async def count_pending_posts(self):
+        """Count pending posts that haven't been sent to Discord"""
+        if not self.available:
+            return await asyncio.to_thread(db.count_pending_posts)
+
+        return await self.fetchval(
+            "SELECT COUNT(*) FROM linkedin_drafts WHERE status = $1 AND discord_message_id IS NULL",
+            PostStatus.PENDING.value
+        )
+
+    async def count_approved_posts(self):
+        """Count approved posts that haven't been published"""
+        if not self.available:
+            return await asyncio.to_thread(db.count_approved_posts)
+
+        return await self.fetchval(
+            "SELECT COUNT(*) FROM linkedin_drafts WHERE status = $1 AND linkedin_post_id IS NULL",
+            PostStatus.APPROVED_FOR_SOCIALS.value
+        )
+
+    async def create_post(self, content, **kwargs):
+        """Create a new pending LinkedIn draft and return its draft_id"""
+        if not self.available:
+            post = await asyncio.to_thread(db.create_post, content, **kwargs)
+            return post.draft_id
+
+        unknown = set(kwargs) - _DRAFT_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown linkedin_drafts columns: {', '.join(sorted(unknown))}")
+
+        # Same defaults as Database.create_post
+        fields = {
+            'draft_id': kwargs.pop('draft_id', str(uuid.uuid4())),
+            'post': content,
+            'status': PostStatus.PENDING.value,
+            'source': kwargs.pop('source', 'discord-bot'),
+            'retry_count': 0,
+            **kwargs
+        }
+        for key in _DRAFT_JSONB_COLUMNS.intersection(fields):
+            if fields[key] is not None:
+                fields[key] = json.dumps(fields[key])
+        columns = ", ".join(fields)
+        placeholders = ", ".join(f"${i}" for i in range(1, len(fields) + 1))
+
+        return await self.fetchval(
+            f"INSERT INTO linkedin_drafts ({columns}) VALUES ({placeholders}) RETURNING draft_id",
+            *fields.values()
+        )
+
+# Global pool instance, opened in the bot's setup_hook
+pool = AsyncDatabasePool()
@@ -8,6 +8,8 @@ without enhancements.
 
 Run this script to see the before/after comparison:
     python demo_comparison.py
+
+Set DEMO_SLEEP_SCALE=0 to skip all pauses (e.g. for CI smoke runs).
 """
 
 import logging
@@ -15,6 +17,14 @@ import time
 import os
 from enhanced_logging import get_enhanced_logger, setup_enhanced_logging
 
+# Multiplier for the demo's dramatic pauses; 0 disables them entirely
+_DEMO_SLEEP = float(os.getenv('DEMO_SLEEP_SCALE', '1.0'))
+
+def _sleep(seconds):
+    """Pause between demo steps, scaled by DEMO_SLEEP_SCALE"""
+    if _DEMO_SLEEP:
+        time.sleep(seconds * _DEMO_SLEEP)
+
 def demo_basic_logging():
     """Demonstrate basic Python logging (the "before" scenario)"""
     
@@ -39,7 +49,7 @@ def demo_basic_logging():
     
     # Simulate typical application logging
     print("🔄 Simulating typical application startup and operations...")
-    time.sleep(1)
+    _sleep(1)
     
     main_logger.info("Starting Discord LinkedIn Bot v1.0")
     main_logger.info("Configuration validation completed")
@@ -84,8 +94,9 @@ def demo_enhanced_logging():
     print()
     
     # Reset logging and setup enhanced system
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
+    for handler in logging.root.handlers:
+        handler.close()
+    logging.root.handlers.clear()
     
     setup_enhanced_logging()
     
@@ -97,11 +108,11 @@ def demo_enhanced_logging():
     
     # Show startup banner
     main_logger.startup_banner("Discord LinkedIn Bot", "v1.0")
-    time.sleep(1)
+    _sleep(1)
     
     # Simulate the same operations with enhanced logging
     print("✨ Same operations, enhanced presentation...")
-    time.sleep(1)
+    _sleep(1)
     
     main_logger.system_health("Configuration", "healthy", {"status": "validated"})
     
@@ -125,7 +136,7 @@ def demo_enhanced_logging():
     # Show progress updates
     for i in range(0, 21, 5):
         main_logger.progress_update("Processing queue", i, 20)
-        time.sleep(0.2)
+        _sleep(0.2)
     
     # Show warnings and errors with enhanced presentation
     linkedin_logger.system_health("API Rate Limiter", "warning", {"usage": "80%", "reset": "15min"})
@@ -179,7 +190,7 @@ def demo_side_by_side():
         print(f"   {example['basic']}")
         print("✅ AFTER (Enhanced):")
         print(f"   {example['enhanced']}")
-        time.sleep(1)
+        _sleep(1)
 
 def demo_environment_compatibility():
     """Demonstrate automatic environment detection"""
@@ -201,7 +212,7 @@ def demo_environment_compatibility():
     
     for env, description in environments:
         print(f"{env}: {description}")
-        time.sleep(0.3)
+        _sleep(0.3)
     
     print("\n🎯 Automatic Detection Factors:")
     print("   • Terminal TTY support")
@@ -226,19 +237,19 @@ def main():
     demo_basic_logging()
     
     print("\nNow showing the enhanced version...")
-    time.sleep(1)
+    _sleep(1)
     
     # Show enhanced logging
     demo_enhanced_logging()
     
     print("\nShowing side-by-side examples...")
-    time.sleep(1)
+    _sleep(1)
     
     # Show side-by-side comparison
     demo_side_by_side()
     
     print("\nShowing environment compatibility...")
-    time.sleep(1)
+    _sleep(1)
     
     # Show environment compatibility
     demo_environment_compatibility()
@@ -1,16 +1,21 @@
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import textwrap
+import time
 from datetime import datetime
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
-import requests
 import aiohttp
 
 from config import Config
 from models import db, LinkedInDraft, PostStatus, FormSubmission, FormSubmissionStatus
 from db_monitor import monitor, PostProcessor
+from db_pool import pool as db_pool
 from linkedin_publisher import publisher
 from enhanced_logging import get_enhanced_logger, setup_enhanced_logging, check_dependencies
 try:
@@ -26,12 +31,137 @@ except ImportError:
 setup_enhanced_logging()
 logger = get_enhanced_logger(__name__)
 
+# Mockup fonts are loaded once; fall back to PIL's built-in font if Arial is missing
+try:
+    _FONT_LARGE = ImageFont.truetype("arial.ttf", 16)
+    _FONT_SMALL = ImageFont.truetype("arial.ttf", 12)
+except OSError:
+    _FONT_LARGE = _FONT_SMALL = ImageFont.load_default()
+
+# Mockups only use three colours, so render them as 1-byte palette images
+_MOCKUP_WHITE, _MOCKUP_BLUE, _MOCKUP_BLACK = 0, 1, 2
+_MOCKUP_PALETTE = [255, 255, 255, 0x00, 0x77, 0xB5, 0, 0, 0]
+
+# The header is identical on every mockup, so draw it once and paste it in
+_MOCKUP_HEADER = Image.new('P', (600, 61), _MOCKUP_BLUE)
+_MOCKUP_HEADER.putpalette(_MOCKUP_PALETTE)
+ImageDraw.Draw(_MOCKUP_HEADER).text((20, 20), "LinkedIn Post Preview", fill=_MOCKUP_WHITE, font=_FONT_LARGE)
+
+# Extra spacing that keeps mockup body lines 20px apart
+_LINE_SPACING = 20 - _FONT_SMALL.getbbox("A")[3]
+
+_LINKEDIN_BLUE = 0x0077B5
+
+# Form content layout used by build_comprehensive_content
+_CONTENT_TEMPLATE = (
+    "Industry: {industry}\n"
+    "Target Audience: {audience}\n"
+    "\n"
+    "Situation/Challenge:\n"
+    "{situation}\n"
+    "\n"
+    "Key Insight/Lesson:\n"
+    "{key_insight}\n"
+    "\n"
+    "Experience/Background:\n"
+    "{experience}\n"
+    "\n"
+    "Credibility Signpost: {credibility_signpost}\n"
+    "\n"
+    "Personal Anecdote:\n"
+    "{personal_anecdote}\n"
+    "\n"
+    "Timeframe: {timeframe}"
+)
+_CONTEXT_TEMPLATE = "\n\nContextual Information:\n{contextual_info}"
+
+def _truncate(s, n=200, tail="..."):
+    """Shorten s to at most n characters, ending in tail when cut"""
+    return s if len(s) <= n else s[:n-len(tail)] + tail
+
+def _format_threads(threads):
+    """Render golden_threads (JSONB list, string or None) for an embed field"""
+    if isinstance(threads, list):
+        return ", ".join(map(str, threads))
+    return threads
+
+# LinkedIn health is cached; status commands refresh it in the background once it goes stale
+_LINKEDIN_HEALTH_MAX_AGE = 60  # seconds before a cached result is considered stale
+_LINKEDIN_PROBE_TIMEOUT = 2.0  # seconds allowed for a live probe from a status command
+
+# Post status updates are queued and written in batches by write_status_updates
+_STATUS_BATCH_SIZE = 50
+_status_queue = asyncio.Queue()
+
+async def queue_status_update(draft_id, status, **fields):
+    """Queue a post status update and wait until the batch containing it is committed"""
+    writer = bot.status_writer
+    if writer is None or writer.done():
+        # No writer (startup/shutdown): write this one directly rather than fail after the send
+        await asyncio.to_thread(db.update_post_status, draft_id, status, **fields)
+        return
+    
+    future = asyncio.get_running_loop().create_future()
+    _status_queue.put_nowait((draft_id, status, fields, future))
+    await future
+
+async def write_status_updates():
+    """Write queued post status updates to the database, one transaction per batch"""
+    batch = []
+    try:
+        while True:
+            # Block until there is work, then take whatever else is already waiting
+            batch = [await _status_queue.get()]
+            while len(batch) < _STATUS_BATCH_SIZE and not _status_queue.empty():
+                batch.append(_status_queue.get_nowait())
+            
+            try:
+                await asyncio.to_thread(
+                    db.update_post_statuses,
+                    [(draft_id, status, fields) for draft_id, status, fields, _ in batch]
+                )
+            except Exception as e:
+                # The batch is one transaction, so nothing in it was committed
+                logger.error(f"❌ Failed to write {len(batch)} status updates: {e}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_result(True)
+            batch = []
+    finally:
+        # Shutting down: don't leave callers waiting on updates that will never be resolved
+        while not _status_queue.empty():
+            batch.append(_status_queue.get_nowait())
+        for *_, future in batch:
+            if not future.done():
+                future.cancel()
+
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
 intents.reactions = True
 
-bot = commands.Bot(command_prefix=Config.BOT_PREFIX, intents=intents)
+class LinkedInDiscordBot(commands.Bot):
+    """Discord bot that owns the shared HTTP session, async DB pool and status writer"""
+    
+    status_writer = None
+    
+    async def setup_hook(self):
+        await db_pool.start()
+        self.status_writer = asyncio.create_task(write_status_updates())
+    
+    async def close(self):
+        if self.status_writer is not None:
+            self.status_writer.cancel()
+        await linkedin_bot.close_http()
+        await publisher.close()
+        await db_pool.close()
+        await super().close()
+
+bot = LinkedInDiscordBot(command_prefix=Config.BOT_PREFIX, intents=intents)
 
 class LinkedInPostModal(discord.ui.Modal, title="Create LinkedIn Post"):
     """Modal form for creating LinkedIn posts - matches HTML form structure"""
@@ -75,7 +205,7 @@ class LinkedInPostModal(discord.ui.Modal, title="Create LinkedIn Post"):
     async def on_submit(self, interaction: discord.Interaction):
         """Handle form submission - show second modal for additional fields"""
         try:
-            logger.info(f"📝 LinkedIn post form step 1 submitted by {interaction.user.name}")
+            logger.info("📝 LinkedIn post form step 1 submitted by %s", interaction.user.name)
             
             # Store first modal data temporarily
             user_data = {
@@ -91,7 +221,7 @@ class LinkedInPostModal(discord.ui.Modal, title="Create LinkedIn Post"):
             embed = discord.Embed(
                 title="✅ Step 1 Complete - Continue to Step 2",
                 description="Great! Your core content details have been saved.\n\n**Next:** Please complete the remaining fields to create your LinkedIn post.",
-                color=0x0077B5,  # LinkedIn blue
+                color=_LINKEDIN_BLUE,
                 timestamp=datetime.now()
             )
             
@@ -118,7 +248,7 @@ class LinkedInPostModal(discord.ui.Modal, title="Create LinkedIn Post"):
             )
             
         except Exception as e:
-            logger.error(f"Error handling form submission step 1: {e}")
+            logger.error("Error handling form submission step 1: %s", e)
             await interaction.response.send_message("❌ Error processing form. Please try again.", ephemeral=True)
 
 class LinkedInPostModalStep2(discord.ui.Modal, title="LinkedIn Post - Additional Details"):
@@ -174,7 +304,8 @@ class LinkedInPostModalStep2(discord.ui.Modal, title="LinkedIn Post - Additional
         """Handle final form submission"""
         try:
             await interaction.response.defer()
-            logger.info(f"📝 LinkedIn post form completed by {self.first_step_data['username']}")
+            now = datetime.now()
+            logger.info("📝 LinkedIn post form completed by %s", self.first_step_data['username'])
             
             # Combine all form data
             full_form_data = {
@@ -188,29 +319,32 @@ class LinkedInPostModalStep2(discord.ui.Modal, title="LinkedIn Post - Additional
                 'spelling_error': ""   # Optional field
             }
             
-            # Create form submission in database (not a LinkedIn draft yet)
-            form_submission = db.create_form_submission(
+            # Create form submission in database (not a LinkedIn draft yet). This is committed
+            # before n8n hears about it, so its callback always finds the row
+            form_submission = await asyncio.to_thread(
+                db.create_form_submission,
                 form_data=full_form_data,
                 source=f"discord-form-{full_form_data['username']}"
             )
+            submission_id = form_submission.submission_id
             
             # Send form data to n8n webhook for LLM processing
-            webhook_success = await self.send_to_n8n_webhook(full_form_data, str(form_submission.submission_id))
+            webhook_success = await self.send_to_n8n_webhook(full_form_data, str(submission_id))
             
             if webhook_success:
                 embed = discord.Embed(
                     title="✅ Form Submitted & Sent to n8n",
-                    description=f"Form submission ID: `{form_submission.submission_id}` sent to n8n for LinkedIn post generation",
+                    description=f"Form submission ID: `{submission_id}` sent to n8n for LinkedIn post generation",
                     color=0x00FF00,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 embed.add_field(name="📊 Status", value="Processing via LLM workflow", inline=True)
             else:
                 embed = discord.Embed(
                     title="⚠️ Form Submitted (Webhook Failed)",
-                    description=f"Form submission ID: `{form_submission.submission_id}` created but n8n webhook failed",
+                    description=f"Form submission ID: `{submission_id}` created but n8n webhook failed",
                     color=0xFFA500,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 embed.add_field(name="📊 Status", value="Saved in database, webhook failed", inline=True)
             
@@ -219,53 +353,28 @@ class LinkedInPostModalStep2(discord.ui.Modal, title="LinkedIn Post - Additional
             embed.add_field(name="👥 Audience", value=full_form_data['audience'], inline=True)
             
             # Add situation preview
-            situation_preview = full_form_data['situation'][:100] + "..." if len(full_form_data['situation']) > 100 else full_form_data['situation']
-            embed.add_field(name="🎯 Situation", value=situation_preview, inline=False)
+            embed.add_field(name="🎯 Situation", value=_truncate(full_form_data['situation'], 100), inline=False)
             
             # Add insight preview
-            insight_preview = full_form_data['key_insight'][:100] + "..." if len(full_form_data['key_insight']) > 100 else full_form_data['key_insight']
-            embed.add_field(name="💡 Key Insight", value=insight_preview, inline=False)
+            embed.add_field(name="💡 Key Insight", value=_truncate(full_form_data['key_insight'], 100), inline=False)
             
-            embed.set_footer(text=f"Created by @{full_form_data['username']} • {datetime.now().strftime('%H:%M')}")
+            embed.set_footer(text=f"Created by @{full_form_data['username']} • {now.strftime('%H:%M')}")
             
             await interaction.followup.send(embed=embed)
-            logger.info(f"Form submission created by {full_form_data['username']}: {form_submission.submission_id}")
+            logger.info("Form submission created by %s: %s", full_form_data['username'], submission_id)
             
         except Exception as e:
-            logger.error(f"Error handling complete form submission: {e}")
+            logger.error("Error handling complete form submission: %s", e)
             await interaction.followup.send("❌ Error creating post. Please try again.", ephemeral=True)
     
     def build_comprehensive_content(self, data):
         """Build comprehensive content from all form fields"""
-        content_parts = [
-            f"Industry: {data['industry']}",
-            f"Target Audience: {data['audience']}",
-            f"",
-            f"Situation/Challenge:",
-            data['situation'],
-            f"",
-            f"Key Insight/Lesson:",
-            data['key_insight'],
-            f"",
-            f"Experience/Background:",
-            data['experience'],
-            f"",
-            f"Credibility Signpost: {data['credibility_signpost']}",
-            f"",
-            f"Personal Anecdote:",
-            data['personal_anecdote'],
-            f"",
-            f"Timeframe: {data['timeframe']}"
-        ]
+        content = _CONTENT_TEMPLATE.format_map(data)
         
         if data['contextual_info']:
-            content_parts.extend([
-                f"",
-                f"Contextual Information:",
-                data['contextual_info']
-            ])
+            content += _CONTEXT_TEMPLATE.format_map(data)
         
-        return "\n".join(content_parts)
+        return content
     
     async def send_to_n8n_webhook(self, form_data, submission_id):
         """Send form data directly to n8n webhook"""
@@ -296,25 +405,24 @@ class LinkedInPostModalStep2(discord.ui.Modal, title="LinkedIn Post - Additional
                 "source": "discord-linkedin-bot"
             }
             
-            logger.info(f"🔗 Sending form submission {submission_id} to n8n webhook: {webhook_url}")
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.text()
-                        logger.info(f"✅ n8n webhook success for submission {submission_id}: {response.status}")
-                        return True
-                    else:
-                        logger.error(f"❌ n8n webhook failed for submission {submission_id}: {response.status} - {await response.text()}")
-                        return False
+            logger.info("🔗 Sending form submission %s to n8n webhook: %s", submission_id, webhook_url)
+            
+            session = await linkedin_bot.get_http()
+            async with session.post(
+                webhook_url,
+                json=payload,
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                if response.status == 200:
+                    result = await response.text()
+                    logger.info("✅ n8n webhook success for submission %s: %s", submission_id, response.status)
+                    return True
+                else:
+                    logger.error("❌ n8n webhook failed for submission %s: %s - %s", submission_id, response.status, await response.text())
+                    return False
                         
         except Exception as e:
-            logger.error(f"❌ Error sending to n8n webhook: {e}")
+            logger.error("❌ Error sending to n8n webhook: %s", e)
             return False
 
 class SecondFormView(discord.ui.View):
@@ -328,7 +436,11 @@ class SecondFormView(discord.ui.View):
     async def continue_form(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Open the second form with remaining fields"""
         await interaction.response.send_modal(self.modal)
-        # Update the original message to show the user has proceeded
+        # Update the original message in the background; the modal is already open
+        self._edit_task = asyncio.create_task(self._mark_step_opened(interaction))
+    
+    async def _mark_step_opened(self, interaction):
+        """Update the original message to show the user has proceeded"""
         try:
             embed = discord.Embed(
                 title="📝 Step 2 Form Opened",
@@ -360,13 +472,15 @@ class ApprovalView(discord.ui.View):
         try:
             # Defer the response to give us time to process
             await interaction.response.defer()
+            now = datetime.now()
             
             # Update database based on action
             if action == 'approved':
                 # Handle Discord's new username system (discriminator can be None)
                 user_identifier = f"{interaction.user.name}#{interaction.user.discriminator}" if interaction.user.discriminator else interaction.user.name
                 
-                db.update_post_status(
+                await asyncio.to_thread(
+                    db.update_post_status,
                     self.draft_id,
                     PostStatus.APPROVED_FOR_SOCIALS,
                     discord_approver=user_identifier
@@ -377,7 +491,7 @@ class ApprovalView(discord.ui.View):
                     title="✅ Post Approved",
                     description=f"Post `{self.draft_id}` approved by {interaction.user.mention}",
                     color=0x00FF00,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
                 logger.post_activity('approved', self.draft_id, f"by {interaction.user.name}")
@@ -386,7 +500,8 @@ class ApprovalView(discord.ui.View):
                 # Handle Discord's new username system (discriminator can be None)
                 user_identifier = f"{interaction.user.name}#{interaction.user.discriminator}" if interaction.user.discriminator else interaction.user.name
                 
-                db.update_post_status(
+                await asyncio.to_thread(
+                    db.update_post_status,
                     self.draft_id,
                     PostStatus.DECLINED,
                     discord_approver=user_identifier,
@@ -398,7 +513,7 @@ class ApprovalView(discord.ui.View):
                     title="❌ Post Rejected",
                     description=f"Post `{self.draft_id}` rejected by {interaction.user.mention}",
                     color=0xFF0000,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
                 logger.post_activity('rejected', self.draft_id, f"by {interaction.user.name}")
@@ -407,7 +522,8 @@ class ApprovalView(discord.ui.View):
                 # Handle Discord's new username system (discriminator can be None)
                 user_identifier = f"{interaction.user.name}#{interaction.user.discriminator}" if interaction.user.discriminator else interaction.user.name
                 
-                db.update_post_status(
+                await asyncio.to_thread(
+                    db.update_post_status,
                     self.draft_id,
                     PostStatus.PENDING,
                     discord_approver=user_identifier,
@@ -419,7 +535,7 @@ class ApprovalView(discord.ui.View):
                     title="📝 Edit Requested",
                     description=f"Edit requested for post `{self.draft_id}` by {interaction.user.mention}",
                     color=0xFFA500,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
                 logger.post_activity('edited', self.draft_id, f"edit requested by {interaction.user.name}")
@@ -432,7 +548,7 @@ class ApprovalView(discord.ui.View):
             await interaction.edit_original_response(embed=embed, view=self)
             
         except Exception as e:
-            logger.error(f"Error handling approval action: {e}")
+            logger.error("Error handling approval action: %s", e)
             await interaction.followup.send(f"❌ Error processing approval: {e}", ephemeral=True)
     
     async def on_timeout(self):
@@ -444,6 +560,69 @@ class LinkedInBot:
     def __init__(self):
         self.approval_channel = None
         self.notification_channel = None
+        self._http = None  # Shared aiohttp session, created on first use
+        self._linkedin_health = None  # (monotonic time, ok) of the last LinkedIn probe
+        self._linkedin_probe_task = None  # Probe in flight, shared by concurrent status commands
+    
+    async def get_http(self):
+        """Return the shared HTTP session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                # Fail fast on unreachable hosts but give n8n time to respond
+                timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=25),
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                )
+            )
+        return self._http
+    
+    def record_linkedin_health(self, ok):
+        """Remember the result of a LinkedIn connection probe"""
+        self._linkedin_health = (time.monotonic(), ok)
+    
+    def _start_linkedin_probe(self):
+        """Start a LinkedIn probe, or return the one already in flight"""
+        if self._linkedin_probe_task is None or self._linkedin_probe_task.done():
+            self._linkedin_probe_task = asyncio.create_task(self._probe_linkedin())
+        return self._linkedin_probe_task
+    
+    async def _probe_linkedin(self):
+        """Probe the LinkedIn API once and cache the result"""
+        try:
+            ok = await asyncio.to_thread(publisher.test_connection)
+        except Exception as e:
+            logger.warning("LinkedIn health probe failed: %s", e)
+            ok = False
+        self.record_linkedin_health(ok)
+        return ok
+    
+    async def linkedin_health(self):
+        """Return the cached LinkedIn health, refreshing it in the background once stale"""
+        if self._linkedin_health is not None:
+            checked_at, ok = self._linkedin_health
+            if time.monotonic() - checked_at > _LINKEDIN_HEALTH_MAX_AGE:
+                # Answer with the last result now; later callers see the refreshed one
+                self._start_linkedin_probe()
+            return ok
+        
+        # Nothing cached yet: wait briefly for a probe, without cancelling it on timeout
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(self._start_linkedin_probe()),
+                timeout=_LINKEDIN_PROBE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return False
+    
+    async def close_http(self):
+        """Close the shared HTTP session"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
         
     async def setup_channels(self):
         """Setup Discord channels"""
@@ -470,11 +649,11 @@ class LinkedInBot:
                 logger.error("Approval channel not available")
                 return
             
-            # Create LinkedIn-style preview embed
-            embed = self.create_post_preview_embed(post)
-            
-            # Generate mockup image
-            mockup_file = await self.create_linkedin_mockup(post)
+            # Build the preview embed and the mockup image concurrently
+            embed, mockup_file = await asyncio.gather(
+                asyncio.to_thread(self.create_post_preview_embed, post),
+                self.create_linkedin_mockup(post)
+            )
             
             # Create approval buttons
             view = ApprovalView(post.draft_id)
@@ -488,15 +667,27 @@ class LinkedInBot:
             )
             
             # Update database with Discord message ID
-            db.update_post_status(
-                post.draft_id,
-                PostStatus.PENDING,
-                discord_message_id=str(message.id),
-                discord_channel_id=str(self.approval_channel.id)
-            )
+            try:
+                await queue_status_update(
+                    post.draft_id,
+                    PostStatus.PENDING,
+                    discord_message_id=str(message.id),
+                    discord_channel_id=str(self.approval_channel.id)
+                )
+            except Exception:
+                # Without a stored message ID the monitor sends this draft again; drop this copy
+                try:
+                    await message.delete()
+                except discord.HTTPException:
+                    pass
+                raise
             
             logger.post_activity('created', post.draft_id, 'sent to Discord for approval')
             
+        except discord.NotFound as e:
+            # The cached channel was deleted; resolve it again on the next request
+            self.approval_channel = None
+            logger.error(f"Approval channel missing while sending post {post.draft_id}: {e}")
         except Exception as e:
             logger.error(f"Error sending approval request for post {post.draft_id}: {e}")
     
@@ -504,126 +695,78 @@ class LinkedInBot:
         """Create a Discord embed showing LinkedIn post preview"""
         preview = PostProcessor.create_linkedin_preview(post)
         
-        embed = discord.Embed(
-            title="📱 LinkedIn Post Preview",
-            description=preview["content"],
-            color=0x0077B5,  # LinkedIn blue
-            timestamp=datetime.now()
-        )
-        
-        # Add post metadata
-        embed.add_field(
-            name="📊 Post Analytics",
-            value=f"**Characters:** {preview['character_count']}/3000\n"
-                  f"**Estimated Engagement:** {preview['estimated_engagement']}\n"
-                  f"**Has Image:** {'Yes' if preview['has_image'] else 'No'}",
-            inline=True
+        # Optional fields as (name, value, inline); empty values are dropped below
+        optional_fields = (
+            ("🏢 Industry", post.industry, True),
+            ("🎯 Target Audience", post.audience, True),
+            ("🧵 Golden Threads", _format_threads(post.golden_threads), False),
+            ("# Hashtags", " ".join(preview["hashtags"]), True),
+            ("@ Mentions", " ".join(preview["mentions"]), True)
         )
         
-        if post.industry:
-            embed.add_field(
-                name="🏢 Industry",
-                value=post.industry,
-                inline=True
-            )
-        
-        if post.audience:
-            embed.add_field(
-                name="🎯 Target Audience",
-                value=post.audience,
-                inline=True
-            )
-        
-        if post.golden_threads:
-            embed.add_field(
-                name="🧵 Golden Threads",
-                value=post.golden_threads,
-                inline=False
-            )
-        
-        # Add hashtags and mentions if present
-        if preview["hashtags"]:
-            embed.add_field(
-                name="# Hashtags",
-                value=" ".join(preview["hashtags"]),
-                inline=True
-            )
-        
-        if preview["mentions"]:
-            embed.add_field(
-                name="@ Mentions",
-                value=" ".join(preview["mentions"]),
-                inline=True
-            )
+        data = {
+            "type": "rich",
+            "title": "📱 LinkedIn Post Preview",
+            "description": preview["content"],
+            "color": _LINKEDIN_BLUE,
+            "timestamp": datetime.now().astimezone().isoformat(),
+            "fields": [
+                {
+                    "name": "📊 Post Analytics",
+                    "value": f"**Characters:** {preview['character_count']}/3000\n"
+                             f"**Estimated Engagement:** {preview['estimated_engagement']}\n"
+                             f"**Has Image:** {'Yes' if preview['has_image'] else 'No'}",
+                    "inline": True
+                },
+                *(
+                    {"name": name, "value": value, "inline": inline}
+                    for name, value, inline in optional_fields if value
+                )
+            ],
+            "footer": {
+                "text": f"Post ID: {post.draft_id} | Created: {post.created_at.strftime('%Y-%m-%d %H:%M')}"
+            }
+        }
         
         # Add image if present
         if post.image_path:
-            embed.set_image(url=post.image_path)
-        
-        embed.set_footer(
-            text=f"Post ID: {post.draft_id} | Created: {post.created_at.strftime('%Y-%m-%d %H:%M')}"
-        )
+            data["image"] = {"url": post.image_path}
         
-        return embed
+        return discord.Embed.from_dict(data)
     
     async def create_linkedin_mockup(self, post):
         """Create a LinkedIn-style mockup image"""
         try:
-            # Create a simple mockup (you can enhance this with more sophisticated graphics)
-            width, height = 600, 400
-            img = Image.new('RGB', (width, height), color='white')
-            draw = ImageDraw.Draw(img)
-            
-            # Try to use a nice font, fallback to default
-            try:
-                font_large = ImageFont.truetype("arial.ttf", 16)
-                font_small = ImageFont.truetype("arial.ttf", 12)
-            except:
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # LinkedIn header
-            draw.rectangle([(0, 0), (width, 60)], fill='#0077B5')
-            draw.text((20, 20), "LinkedIn Post Preview", fill='white', font=font_large)
-            
-            # Post content
-            content = post.content
-            if len(content) > 300:
-                content = content[:297] + "..."
-            
-            # Wrap text
-            lines = []
-            words = content.split()
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                if len(test_line) > 70:  # Approximate character limit per line
-                    lines.append(current_line)
-                    current_line = word
-                else:
-                    current_line = test_line
-            
-            if current_line:
-                lines.append(current_line)
-            
-            # Draw text lines
-            y_offset = 80
-            for line in lines[:15]:  # Limit to 15 lines
-                draw.text((20, y_offset), line, fill='black', font=font_small)
-                y_offset += 20
-            
-            # Save to bytes
-            img_bytes = BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            return discord.File(img_bytes, filename=f"linkedin_preview_{post.draft_id}.png")
+            # Render off the event loop so gateway heartbeats and other interactions keep flowing
+            png_bytes = await asyncio.to_thread(self._render_mockup_sync, post)
+            return discord.File(BytesIO(png_bytes), filename=f"linkedin_preview_{post.draft_id}.png")
             
         except Exception as e:
             logger.error(f"Error creating LinkedIn mockup: {e}")
             return None
     
+    def _render_mockup_sync(self, post):
+        """Render the mockup with PIL and return PNG bytes"""
+        # Create a simple mockup (you can enhance this with more sophisticated graphics)
+        width, height = 600, 400
+        img = Image.new('P', (width, height), _MOCKUP_WHITE)
+        img.putpalette(_MOCKUP_PALETTE)
+        img.paste(_MOCKUP_HEADER, (0, 0))
+        draw = ImageDraw.Draw(img)
+        
+        # Post content
+        content = _truncate(post.content, 300)
+        
+        # Wrap to ~70 characters per line, at most 15 lines, and draw in one call
+        lines = textwrap.wrap(content, width=70, max_lines=15, placeholder="...")
+        draw.multiline_text((20, 80), "\n".join(lines), fill=_MOCKUP_BLACK, font=_FONT_SMALL, spacing=_LINE_SPACING)
+        
+        # Save to bytes
+        img_bytes = BytesIO()
+        img.save(img_bytes, format='PNG', optimize=False, compress_level=1)
+        
+        return img_bytes.getvalue()
+    
     async def publish_to_linkedin(self, post):
         """Publish approved post to LinkedIn"""
         try:
@@ -648,7 +791,7 @@ class LinkedInBot:
                     
                     embed.add_field(
                         name="📝 Content Preview",
-                        value=post.content[:200] + "..." if len(post.content) > 200 else post.content,
+                        value=_truncate(post.content),
                         inline=False
                     )
                     
@@ -673,10 +816,10 @@ class LinkedInBot:
                     
                     await self.notification_channel.send(embed=embed)
                 
-                logger.error(f"❌ Failed to publish post {post.draft_id}: {result.get('error')}")
+                logger.error("❌ Failed to publish post %s: %s", post.draft_id, result.get('error'))
                 
         except Exception as e:
-            logger.error(f"Error in publish_to_linkedin: {e}")
+            logger.error("Error in publish_to_linkedin: %s", e)
 
 # Global bot instance
 linkedin_bot = LinkedInBot()
@@ -692,7 +835,7 @@ async def on_ready():
     
     # Display bot statistics
     guild_count = len(bot.guilds)
-    total_members = sum(guild.member_count for guild in bot.guilds if guild.member_count)
+    total_members = sum(guild.member_count or 0 for guild in bot.guilds)
     logger.info(f"🏠 Connected to {guild_count} guilds with {total_members} total members")
     
     # Start the command sync task
@@ -702,9 +845,13 @@ async def on_ready():
     # Note: Approval process removed - posts go directly to n8n webhook
     logger.info("📝 Direct-to-n8n mode: Posts will be sent directly to webhook without approval")
     
-    # Test LinkedIn connection with enhanced feedback
+    # Test LinkedIn connection while resolving Discord channels
     logger.info("🔗 Testing LinkedIn API connection...")
-    connection_success = publisher.test_connection()
+    connection_success, _ = await asyncio.gather(
+        asyncio.to_thread(publisher.test_connection),
+        linkedin_bot.setup_channels()
+    )
+    linkedin_bot.record_linkedin_health(connection_success)
     logger.connection_status("LinkedIn API", connection_success, 
                            "Ready for automated posting" if connection_success else "Check API credentials")
     
@@ -719,103 +866,65 @@ async def on_ready():
 
 # Reaction-based approval removed - now using Discord UI buttons
 
-# Slash Commands
-@bot.tree.command(name="status", description="Check bot status and statistics")
-async def status_slash(interaction: discord.Interaction):
-    """Check bot status via slash command"""
-    embed = discord.Embed(
-        title="🤖 Bot Status",
-        color=0x0077B5,
-        timestamp=datetime.now()
+async def _build_status_embed():
+    """Run the status health checks concurrently and build the status embed"""
+    pending_count, approved_count, linkedin_ok = await asyncio.gather(
+        db_pool.count_pending_posts(),
+        db_pool.count_approved_posts(),
+        linkedin_bot.linkedin_health(),
+        return_exceptions=True
     )
     
-    # Database connection
-    try:
-        pending_count = len(db.get_pending_posts())
-        approved_count = len(db.get_approved_posts())
-        embed.add_field(
-            name="📊 Database",
-            value=f"✅ Connected\nPending: {pending_count}\nApproved: {approved_count}",
-            inline=True
-        )
-    except Exception as e:
-        embed.add_field(
-            name="📊 Database",
-            value=f"❌ Error: {str(e)[:50]}",
-            inline=True
-        )
-    
-    # LinkedIn API
-    linkedin_status = "✅ Connected" if publisher.test_connection() else "❌ Disconnected"
-    embed.add_field(
-        name="🔗 LinkedIn API",
-        value=linkedin_status,
-        inline=True
-    )
+    # Work out every field value before building the embed
+    db_error = next((r for r in (pending_count, approved_count) if isinstance(r, Exception)), None)
+    if db_error is None:
+        db_status = f"✅ Connected\nPending: {pending_count}\nApproved: {approved_count}"
+    else:
+        db_status = f"❌ Error: {str(db_error)[:50]}"
     
-    # Channels
+    # A failed probe counts as disconnected
+    linkedin_status = "✅ Connected" if linkedin_ok is True else "❌ Disconnected"
     approval_status = "✅ Found" if linkedin_bot.approval_channel else "❌ Not Found"
-    embed.add_field(
-        name="📢 Approval Channel",
-        value=approval_status,
-        inline=True
+    
+    embed = discord.Embed(
+        title="🤖 Bot Status",
+        color=_LINKEDIN_BLUE,
+        timestamp=datetime.now()
     )
+    for name, value in (
+        ("📊 Database", db_status),
+        ("🔗 LinkedIn API", linkedin_status),
+        ("📢 Approval Channel", approval_status)
+    ):
+        embed.add_field(name=name, value=value, inline=True)
     
-    await interaction.response.send_message(embed=embed)
+    return embed
+
+# Slash Commands
+@bot.tree.command(name="status", description="Check bot status and statistics")
+async def status_slash(interaction: discord.Interaction):
+    """Check bot status via slash command"""
+    # Acknowledge first: the health checks can outlast Discord's 3-second deadline
+    await interaction.response.defer(thinking=True)
+    embed = await _build_status_embed()
+    await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="linkedin", description="Create a new LinkedIn post for approval")
 async def linkedin_slash(interaction: discord.Interaction):
     """Show LinkedIn post creation form"""
-    logger.info(f"🎯 LinkedIn slash command called by {interaction.user.name}")
+    logger.info("🎯 LinkedIn slash command called by %s", interaction.user.name)
     try:
         modal = LinkedInPostModal()
         await interaction.response.send_modal(modal)
-        logger.info(f"📝 LinkedIn post form shown to {interaction.user.name}")
+        logger.info("📝 LinkedIn post form shown to %s", interaction.user.name)
     except Exception as e:
-        logger.error(f"Error showing LinkedIn form: {e}")
+        logger.error("Error showing LinkedIn form: %s", e)
         await interaction.response.send_message("❌ Error opening LinkedIn post form.", ephemeral=True)
 
 @bot.command(name='status')
 async def status_command(ctx):
     """Check bot status"""
-    embed = discord.Embed(
-        title="🤖 Bot Status",
-        color=0x0077B5,
-        timestamp=datetime.now()
-    )
-    
-    # Database connection
-    try:
-        pending_count = len(db.get_pending_posts())
-        approved_count = len(db.get_approved_posts())
-        embed.add_field(
-            name="📊 Database",
-            value=f"✅ Connected\nPending: {pending_count}\nApproved: {approved_count}",
-            inline=True
-        )
-    except Exception as e:
-        embed.add_field(
-            name="📊 Database",
-            value=f"❌ Error: {str(e)[:50]}",
-            inline=True
-        )
-    
-    # LinkedIn API
-    linkedin_status = "✅ Connected" if publisher.test_connection() else "❌ Disconnected"
-    embed.add_field(
-        name="🔗 LinkedIn API",
-        value=linkedin_status,
-        inline=True
-    )
-    
-    # Channels
-    approval_status = "✅ Found" if linkedin_bot.approval_channel else "❌ Not Found"
-    embed.add_field(
-        name="📢 Approval Channel",
-        value=approval_status,
-        inline=True
-    )
-    
+    embed = await _build_status_embed()
     await ctx.send(embed=embed)
 
 @bot.command(name='test_post')
@@ -827,18 +936,41 @@ async def test_post_command(ctx, *, content="This is a test LinkedIn post from t
     
     try:
         # Create test post
-        post = db.create_post(
+        draft_id = await db_pool.create_post(
             content=content,
             industry="Technology",
             audience="Tech professionals",
-            golden_threads="Test post"
+            golden_threads=["Test post"]
         )
         
-        await ctx.send(f"✅ Created test post with ID: {post.draft_id}")
+        await ctx.send(f"✅ Created test post with ID: {draft_id}")
         
     except Exception as e:
         await ctx.send(f"❌ Error creating test post: {e}")
 
+# Hash of the last command tree synced to Discord
+_CMD_SYNC_HASH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cmd_sync_hash')
+
+def _command_tree_hash(commands_list):
+    """Hash the registered slash commands (and target guild) to detect changes"""
+    payload = []
+    for command in commands_list:
+        try:
+            payload.append(command.to_dict(bot.tree))
+        except TypeError:
+            payload.append(command.to_dict())  # discord.py < 2.4 takes no tree argument
+    
+    data = json.dumps({"guild": Config.DISCORD_GUILD_ID, "commands": payload}, sort_keys=True, default=str)
+    return hashlib.blake2b(data.encode()).hexdigest()
+
+def _read_cmd_sync_hash():
+    """Return the hash stored after the last successful sync, if any"""
+    try:
+        with open(_CMD_SYNC_HASH_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
 # Command sync task - runs after bot is ready and commands are defined
 @tasks.loop(count=1)  # Run only once
 async def sync_commands_after_ready():
@@ -847,24 +979,49 @@ async def sync_commands_after_ready():
         await bot.wait_until_ready()
         await asyncio.sleep(2)  # Wait a bit for full initialization
         
+        # Read the command tree once for hashing, logging and the guild copy
+        commands_list = bot.tree.get_commands()
+        
+        # Skip the slow sync API calls when commands have not changed since the last run
+        tree_hash = _command_tree_hash(commands_list)
+        if tree_hash == _read_cmd_sync_hash():
+            logger.info("⏭️  Slash commands unchanged since last sync, skipping command sync")
+            return
+        
         logger.info("🔄 Starting post-initialization command sync...")
         
         # Debug: Show what commands are in the tree
-        all_commands = [cmd.name for cmd in bot.tree.get_commands()]
+        all_commands = [cmd.name for cmd in commands_list]
         logger.info(f"📋 Commands in tree before sync: {all_commands}")
         
-        # Prioritize guild sync for immediate availability
+        # Guild sync gives immediate availability; global sync takes up to 1 hour to propagate.
+        # The two endpoints are independent, so run them together
+        scopes = []
         if hasattr(Config, 'DISCORD_GUILD_ID') and Config.DISCORD_GUILD_ID:
             guild = discord.Object(id=int(Config.DISCORD_GUILD_ID))
             # Copy global commands to guild for immediate availability
-            for command in bot.tree.get_commands():
-                bot.tree.add_command(command, guild=guild)
-            synced_guild = await bot.tree.sync(guild=guild)
-            logger.info(f"🎯 Synced {len(synced_guild)} slash commands to guild: {[cmd.name for cmd in synced_guild]}")
+            bot.tree.copy_global_to(guild=guild)
+            scopes.append(("🎯", "guild", guild))
+        scopes.append(("🌍", "global", None))
+        
+        results = await asyncio.gather(
+            *(bot.tree.sync(guild=guild) for _, _, guild in scopes),
+            return_exceptions=True
+        )
+        
+        # Report each scope separately so one failure doesn't hide the other
+        all_synced = True
+        for (emoji, scope, _), synced in zip(scopes, results):
+            if isinstance(synced, Exception):
+                all_synced = False
+                logger.error(f"❌ Failed to sync {scope} slash commands: {synced}")
+            else:
+                logger.info(f"{emoji} Synced {len(synced)} {scope} slash commands: {[cmd.name for cmd in synced]}")
         
-        # Also sync globally (takes up to 1 hour to propagate)
-        synced_global = await bot.tree.sync()
-        logger.info(f"🌍 Synced {len(synced_global)} global slash commands: {[cmd.name for cmd in synced_global]}")
+        # Only remember the tree once every scope is in sync, so failures retry next start
+        if all_synced:
+            with open(_CMD_SYNC_HASH_FILE, 'w') as f:
+                f.write(tree_hash)
         
         logger.info(f"⚡ Post-initialization command sync complete!")
         
@@ -3,8 +3,11 @@ Enhanced Logging System for Discord LinkedIn Bot
 Provides beautiful, color-coded terminal output with emojis and visual hierarchy
 """
 import logging
+import re
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import os
 
@@ -52,12 +55,53 @@ class EnhancedFormatter(logging.Formatter):
         'default': {'emoji': '📝', 'color': Fore.WHITE}
     }
     
+    # Keyword highlights: (lowercase trigger, ((needle, styled replacement), ...))
+    KEYWORD_HIGHLIGHTS = (
+        ('discord', (('Discord', f"{Fore.BLUE}Discord{Style.RESET_ALL}"),)),
+        ('linkedin', (
+            ('LinkedIn', f"{Fore.BLUE}LinkedIn{Style.RESET_ALL}"),
+            ('API', f"{Style.BRIGHT}API{Style.RESET_ALL}"),
+        )),
+        ('connected', (('connected', f"{Fore.GREEN}connected{Style.RESET_ALL}"),)),
+        ('failed', (('failed', f"{Fore.RED}failed{Style.RESET_ALL}"),)),
+        ('successful', (('successful', f"{Fore.GREEN}successful{Style.RESET_ALL}"),)),
+    )
+    
+    # Longer messages are printed without highlighting
+    MAX_HIGHLIGHT_LENGTH = 256
+    
+    # Numbers/IDs and post IDs, with their styled replacements
+    _NUM_RE = re.compile(r'(\d+)')
+    _NUM_SUB = f"{Style.BRIGHT}\\1{Style.RESET_ALL}"
+    _POST_RE = re.compile(r'(post_\w+|draft_\w+)')
+    _POST_SUB = f"{Fore.CYAN}\\1{Style.RESET_ALL}"
+    
+    # Many records share a second; every logger's formatter reuses its timestamp
+    _ts_cache = (None, "")
+    
     def __init__(self):
         super().__init__()
         # Check if terminal supports colors
-        self.use_colors = self._supports_colors()
-        
-    def _supports_colors(self) -> bool:
+        self.use_colors = USE_COLORS
+        if not self.use_colors:
+            # NO_COLOR, CI or no tty: go straight to the plain formatter for every record
+            self.format = self._format_plain
+        # Logger names and levels come from small fixed sets; style each once
+        self._name_cache: Dict[str, tuple] = {}
+        self._level_cache: Dict[str, str] = {}
+        
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record time as HH:MM:SS, cached per second across all formatters"""
+        sec = int(created)
+        cached_sec, cached_str = EnhancedFormatter._ts_cache
+        if sec != cached_sec:
+            cached_str = time.strftime('%H:%M:%S', time.localtime(sec))
+            # One tuple swap so other threads never see a mismatched pair
+            EnhancedFormatter._ts_cache = (sec, cached_str)
+        return cached_str
+    
+    @staticmethod
+    def _supports_colors() -> bool:
         """Check if terminal supports colors"""
         if not COLORAMA_AVAILABLE:
             return False
@@ -74,41 +118,46 @@ class EnhancedFormatter(logging.Formatter):
         return sys.stdout.isatty()
     
     def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors and emojis"""
-        if not self.use_colors:
-            return self._format_plain(record)
-        
+        """Format log record with colors and emojis (plain-mode instances use _format_plain instead)"""
         return self._format_enhanced(record)
     
     def _format_plain(self, record: logging.LogRecord) -> str:
         """Plain text formatting without colors"""
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
+        timestamp = self._format_timestamp(record.created)
         level_name = record.levelname.ljust(8)
-        component = record.name.split('.')[-1]
+        component, _ = self._component(record.name)
         
         return f"[{timestamp}] {level_name} {component}: {record.getMessage()}"
     
+    def _style_level(self, levelname: str) -> str:
+        """Build and cache the colored, emoji-prefixed level label"""
+        level_color = self.LEVEL_COLORS.get(levelname, Fore.WHITE)
+        level_emoji = self.LEVEL_EMOJIS.get(levelname, '📝')
+        styled = f"{level_color}{level_emoji} {levelname.ljust(7)}{Style.RESET_ALL}"
+        self._level_cache[levelname] = styled
+        return styled
+    
+    def _component(self, name: str) -> tuple:
+        """Return (component name, styled label) for a logger name, cached"""
+        cached = self._name_cache.get(name)
+        if cached is None:
+            component_name = name.split('.')[-1]
+            component_style = self.COMPONENT_STYLES.get(component_name, self.COMPONENT_STYLES['default'])
+            styled = f"{component_style['color']}{component_style['emoji']} {component_name}{Style.RESET_ALL}"
+            cached = self._name_cache[name] = (component_name, styled)
+        return cached
+    
     def _format_enhanced(self, record: logging.LogRecord) -> str:
         """Enhanced formatting with colors and emojis"""
-        # Get color and emoji for log level
-        level_color = self.LEVEL_COLORS.get(record.levelname, Fore.WHITE)
-        level_emoji = self.LEVEL_EMOJIS.get(record.levelname, '📝')
-        
-        # Get component styling
-        component_name = record.name.split('.')[-1]
-        component_style = self.COMPONENT_STYLES.get(component_name, self.COMPONENT_STYLES['default'])
-        component_emoji = component_style['emoji']
-        component_color = component_style['color']
-        
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
+        timestamp = self._format_timestamp(record.created)
         timestamp_styled = f"{Style.DIM}{Fore.WHITE}[{timestamp}]{Style.RESET_ALL}"
         
-        # Format level with emoji and color
-        level_styled = f"{level_color}{level_emoji} {record.levelname.ljust(7)}{Style.RESET_ALL}"
-        
-        # Format component with emoji and color
-        component_styled = f"{component_color}{component_emoji} {component_name}{Style.RESET_ALL}"
+        # Level and component styling, cached per level name / logger name
+        level_styled = self._level_cache.get(record.levelname)
+        if level_styled is None:
+            level_styled = self._style_level(record.levelname)
+        _, component_styled = self._component(record.name)
         
         # Format message based on content
         message = self._enhance_message(record.getMessage(), record.levelname)
@@ -125,38 +174,37 @@ class EnhancedFormatter(logging.Formatter):
     
     def _enhance_message(self, message: str, level: str) -> str:
         """Enhance message content with contextual styling"""
-        if not self.use_colors:
+        # Highlighting only helps short lines a human will read
+        if not self.use_colors or level == 'DEBUG':
             return message
+        if len(message) > self.MAX_HIGHLIGHT_LENGTH:
+            if '\n' not in message:
+                return message
+            # Multi-line batches: the limit applies to each line
+            return '\n'.join(self._enhance_message(line, level) for line in message.split('\n'))
         
         # Highlight specific patterns in messages
         enhanced = message
+        lowered = message.lower()  # Lowercase once for all keyword checks
+        
+        # Highlight Discord/LinkedIn content and status words
+        for keyword, replacements in self.KEYWORD_HIGHLIGHTS:
+            if keyword in lowered:
+                for needle, replacement in replacements:
+                    enhanced = enhanced.replace(needle, replacement)
         
-        # Highlight Discord-related content
-        if 'discord' in message.lower():
-            enhanced = enhanced.replace('Discord', f"{Fore.BLUE}Discord{Style.RESET_ALL}")
-            
-        # Highlight LinkedIn-related content  
-        if 'linkedin' in message.lower():
-            enhanced = enhanced.replace('LinkedIn', f"{Fore.BLUE}LinkedIn{Style.RESET_ALL}")
-            enhanced = enhanced.replace('API', f"{Style.BRIGHT}API{Style.RESET_ALL}")
-            
-        # Highlight status messages
-        if 'connected' in message.lower():
-            enhanced = enhanced.replace('connected', f"{Fore.GREEN}connected{Style.RESET_ALL}")
-        if 'failed' in message.lower():
-            enhanced = enhanced.replace('failed', f"{Fore.RED}failed{Style.RESET_ALL}")
-        if 'successful' in message.lower():
-            enhanced = enhanced.replace('successful', f"{Fore.GREEN}successful{Style.RESET_ALL}")
-            
         # Highlight numbers and IDs
-        import re
-        enhanced = re.sub(r'(\d+)', f"{Style.BRIGHT}\\1{Style.RESET_ALL}", enhanced)
+        enhanced = self._NUM_RE.sub(self._NUM_SUB, enhanced)
         
-        # Highlight post IDs
-        enhanced = re.sub(r'(post_\w+|draft_\w+)', f"{Fore.CYAN}\\1{Style.RESET_ALL}", enhanced)
+        # Highlight post IDs (substring check first; most lines have none)
+        if 'post_' in enhanced or 'draft_' in enhanced:
+            enhanced = self._POST_RE.sub(self._POST_SUB, enhanced)
         
         return enhanced
 
+# Terminal colour support does not change while the process runs; detect it once
+USE_COLORS = EnhancedFormatter._supports_colors()
+
 class EnhancedLogger:
     """
     Enhanced logger with convenience methods for different message types
@@ -191,7 +239,7 @@ class EnhancedLogger:
         """Display an impressive startup banner with ASCII art"""
         self._clear_terminal()
         
-        if not EnhancedFormatter().use_colors:
+        if not USE_COLORS:
             self.logger.info(f"Starting {title}")
             return
         
@@ -228,20 +276,18 @@ class EnhancedLogger:
             print(line)
         print()
         
-        # Add a fun loading animation effect
-        self._show_loading_animation()
-        print()
+        # Add a fun loading animation effect (cosmetic ~2s pause, so opt-in only)
+        if os.getenv('BOT_FANCY_STARTUP') == '1':
+            self._show_loading_animation()
+            print()
     
     def _clear_terminal(self):
         """Clear the terminal screen"""
-        import os
-        import sys
-        
-        # Clear screen command for different operating systems
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # macOS and Linux
-            os.system('clear')
+        # ANSI clear + cursor home instead of shelling out to cls/clear
+        # (colorama translates the sequence on Windows consoles)
+        if sys.stdout.isatty():
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
     
     def _get_discord_linkedin_ascii_art(self):
         """Generate EPIC ASCII art for Discord LinkedIn Bot"""
@@ -306,53 +352,86 @@ class EnhancedLogger:
     
     def connection_status(self, service: str, status: bool, details: str = None):
         """Log connection status with appropriate styling"""
-        status_emoji = "✅" if status else "❌"
+        level = logging.INFO if status else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+        
         status_text = "CONNECTED" if status else "FAILED"
-        status_color = Fore.GREEN if status else Fore.RED
         
-        if EnhancedFormatter().use_colors:
-            message = f"{status_emoji} {service} connection: {status_color}{status_text}{Style.RESET_ALL}"
+        if USE_COLORS:
+            status_emoji = "✅" if status else "❌"
+            status_color = Fore.GREEN if status else Fore.RED
+            message = "%s %s connection: %s%s%s"
+            args = [status_emoji, service, status_color, status_text, Style.RESET_ALL]
         else:
-            message = f"{service} connection: {status_text}"
+            message = "%s connection: %s"
+            args = [service, status_text]
             
         if details:
-            message += f" - {details}"
+            message += " - %s"
+            args.append(details)
             
-        if status:
-            self.logger.info(message)
-        else:
-            self.logger.error(message)
+        self.logger.log(level, message, *args)
     
     def api_call(self, service: str, endpoint: str, status_code: int, response_time: float = None):
         """Log API calls with status visualization"""
-        status_emoji = "✅" if 200 <= status_code < 300 else "❌" if status_code >= 400 else "⚠️"
+        if 200 <= status_code < 300:
+            level = logging.INFO
+        elif 400 <= status_code < 500:
+            level = logging.WARNING
+        else:
+            level = logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
         
-        message = f"{status_emoji} {service} API: {endpoint} -> {status_code}"
+        status_emoji = "✅" if 200 <= status_code < 300 else "❌" if status_code >= 400 else "⚠️"
         
         if response_time:
-            message += f" ({response_time:.2f}s)"
-            
-        if 200 <= status_code < 300:
-            self.logger.info(message)
-        elif 400 <= status_code < 500:
-            self.logger.warning(message)
+            self.logger.log(level, "%s %s API: %s -> %s (%.2fs)",
+                            status_emoji, service, endpoint, status_code, response_time)
         else:
-            self.logger.error(message)
+            self.logger.log(level, "%s %s API: %s -> %s", status_emoji, service, endpoint, status_code)
     
     def progress_update(self, task: str, current: int, total: int):
         """Log progress updates with visual progress indication"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         percentage = (current / total) * 100 if total > 0 else 0
         
-        if EnhancedFormatter().use_colors:
-            # Create a simple progress bar
-            bar_length = 20
-            filled = int(bar_length * percentage / 100)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            message = f"🔄 {task}: {Fore.CYAN}{bar}{Style.RESET_ALL} {percentage:.1f}% ({current}/{total})"
+        if USE_COLORS:
+            self.logger.info("🔄 %s: %s%s%s %.1f%% (%s/%s)",
+                             task, Fore.CYAN, self._progress_bar(percentage), Style.RESET_ALL,
+                             percentage, current, total)
         else:
-            message = f"{task}: {percentage:.1f}% ({current}/{total})"
-            
-        self.logger.info(message)
+            self.logger.info("%s: %.1f%% (%s/%s)", task, percentage, current, total)
+    
+    @staticmethod
+    def _progress_bar(percentage: float, bar_length: int = 20) -> str:
+        """Create a simple progress bar"""
+        filled = int(bar_length * percentage / 100)
+        return "█" * filled + "░" * (bar_length - filled)
+    
+    def progress_range(self, task: str, total: int, step: int = 1, interval: float = 0.0):
+        """Show a whole run of progress ticks on one line, redrawn in place"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        frames = range(0, total + 1, step)
+        if not USE_COLORS:
+            # Carriage returns are noise in redirected output; log the final tick only
+            self.progress_update(task, frames[-1], total)
+            return
+        
+        stream = sys.stdout
+        for i, current in enumerate(frames):
+            if i and interval:
+                time.sleep(interval)
+            percentage = (current / total) * 100 if total > 0 else 0
+            stream.write(f"\r🔄 {task}: {Fore.CYAN}{self._progress_bar(percentage)}{Style.RESET_ALL} "
+                         f"{percentage:.1f}% ({current}/{total})")
+            stream.flush()
+        stream.write("\n")
     
     def system_health(self, component: str, status: str, metrics: Dict[str, Any] = None):
         """Log system health information"""
@@ -363,19 +442,25 @@ class EnhancedLogger:
             'unknown': '💜'
         }
         
-        emoji = status_emojis.get(status.lower(), '💜')
-        message = f"{emoji} {component} health: {status.upper()}"
+        status_key = status.lower()
+        if status_key == 'healthy':
+            level = logging.INFO
+        elif status_key == 'warning':
+            level = logging.WARNING
+        else:
+            level = logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        emoji = status_emojis.get(status_key, '💜')
+        message = "%s %s health: %s"
+        args = [emoji, component, status.upper()]
         
         if metrics:
-            metric_strs = [f"{k}={v}" for k, v in metrics.items()]
-            message += f" ({', '.join(metric_strs)})"
+            message += " (%s)"
+            args.append(', '.join(f"{k}={v}" for k, v in metrics.items()))
             
-        if status.lower() == 'healthy':
-            self.logger.info(message)
-        elif status.lower() == 'warning':
-            self.logger.warning(message)
-        else:
-            self.logger.error(message)
+        self.logger.log(level, message, *args)
     
     def post_activity(self, action: str, post_id: str, details: str = None):
         """Log post-related activities"""
@@ -388,6 +473,10 @@ class EnhancedLogger:
             'deleted': '🗑️'
         }
         
+        # Skip building the message when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         emoji = action_emojis.get(action.lower(), '📋')
         message = f"{emoji} Post {action}: {post_id}"
         
@@ -396,24 +485,35 @@ class EnhancedLogger:
             
         self.logger.info(message)
     
+    def log_batch(self, level: int, title: str, messages):
+        """Log related messages as one record: a title line then one indented line each"""
+        if not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(level, "%s\n  %s", title, "\n  ".join(messages))
+    
     # Standard logging methods with enhanced functionality
-    def debug(self, message: str):
-        self.logger.debug(message)
+    # Extra args are %-formatted lazily, only if the record is emitted
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        self.logger.error(message, *args)
     
-    def critical(self, message: str):
-        self.logger.critical(message)
+    def critical(self, message: str, *args):
+        self.logger.critical(message, *args)
+
+# Root handler installed by setup_enhanced_logging
+_root_handler = None
 
+@lru_cache(maxsize=None)
 def get_enhanced_logger(name: str) -> EnhancedLogger:
-    """Get an enhanced logger instance"""
+    """Get an enhanced logger instance (one shared instance per name)"""
     return EnhancedLogger(name)
 
 def setup_enhanced_logging():
@@ -421,21 +521,18 @@ def setup_enhanced_logging():
     # Configure root logger to use enhanced formatting
     root_logger = logging.getLogger()
     
-    # Check if enhanced handler already exists
-    enhanced_handler_exists = any(
-        isinstance(h, logging.StreamHandler) and isinstance(h.formatter, EnhancedFormatter)
-        for h in root_logger.handlers
-    )
+    global _root_handler
     
-    if not enhanced_handler_exists:
+    # Skip if the handler we installed is still attached (callers may clear root handlers)
+    if _root_handler is None or _root_handler not in root_logger.handlers:
         # Remove existing handlers
         for handler in root_logger.handlers.copy():
             root_logger.removeHandler(handler)
         
         # Add enhanced handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(EnhancedFormatter())
-        root_logger.addHandler(handler)
+        _root_handler = logging.StreamHandler(sys.stdout)
+        _root_handler.setFormatter(EnhancedFormatter())
+        root_logger.addHandler(_root_handler)
         root_logger.setLevel(logging.INFO)
     
     # Disable duplicate logging from imported libraries
@@ -1,19 +1,78 @@
+import aiohttp
+import asyncio
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+import re
+from types import MappingProxyType
 from datetime import datetime
 from config import Config
 from models import db, PostStatus
 from enhanced_logging import get_enhanced_logger
 
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    # Fallback to the standard library serializer if orjson is not installed
+    _json_dumps = json.dumps
+
 logger = get_enhanced_logger(__name__)
 
+# Retry policy for LinkedIn/n8n POSTs: exponential backoff with full jitter
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# For non-idempotent POSTs (ugcPosts) only retry when the request was certainly not acted on:
+# a 429 rejection, or a failure to connect before anything was sent
+NON_IDEMPOTENT_RETRYABLE_STATUSES = frozenset({429})
+
+# Maximum notifications sent to n8n in one webhook POST
+WEBHOOK_BATCH_SIZE = 50
+# Queued by close() to stop the webhook worker once everything before it is sent
+_WEBHOOK_STOP = object()
+
+# Numeric activity ID from a share/ugcPost URN
+_URN_RE = re.compile(r'urn:li:(?:share|ugcPost):(\d+)')
+
+def _retry_after(response):
+    """Seconds from a Retry-After header, or 0 if missing or not numeric"""
+    try:
+        return max(0.0, float(response.headers.get('Retry-After', 0)))
+    except ValueError:
+        return 0.0
+
 class LinkedInPublisher:
     def __init__(self):
         self.access_token = Config.LINKEDIN_ACCESS_TOKEN
         self.person_id = Config.LINKEDIN_PERSON_ID
         self.base_url = "https://api.linkedin.com/v2"
         
+        # Credentials are fixed at startup, so check them once instead of per publish
+        self._configured = bool(self.access_token and self.person_id)
+        if not self._configured:
+            logger.error("LinkedIn access token or person ID not configured; publishing is disabled")
+        
+        # Auth headers are fixed for the process lifetime; build them once
+        self._headers = MappingProxyType(self._get_headers())
+        
+        # Shared session so synchronous LinkedIn calls reuse pooled TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+        self.session.headers.update(self._headers)
+        
+        # Async session for publish/webhook calls, created lazily on the bot's event loop
+        self._aio_session = None
+        
+        # Published-post notifications waiting to be batched to n8n
+        self._webhook_queue = asyncio.Queue()
+        self._webhook_task = None
+        
     def _get_headers(self):
         """Get headers for LinkedIn API requests"""
         return {
@@ -22,9 +81,79 @@ class LinkedInPublisher:
             "X-Restli-Protocol-Version": "2.0.0"
         }
     
+    async def _get_aio_session(self):
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_json_dumps
+            )
+        return self._aio_session
+    
+    async def close(self):
+        """Flush queued webhook notifications and close the aiohttp session on shutdown"""
+        # Let the worker finish its in-flight batch and drain the queue instead of cancelling it
+        if self._webhook_task is not None and not self._webhook_task.done():
+            self._webhook_queue.put_nowait(_WEBHOOK_STOP)
+            await self._webhook_task
+        self._webhook_task = None
+        
+        # Anything left over if the worker never started or died
+        pending = []
+        while not self._webhook_queue.empty():
+            pending.append(self._webhook_queue.get_nowait())
+        for i in range(0, len(pending), WEBHOOK_BATCH_SIZE):
+            await self._send_webhook_batch(pending[i:i + WEBHOOK_BATCH_SIZE])
+        
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+    
+    async def _post_with_retry(self, url, payload, max_attempts=RETRY_MAX_ATTEMPTS,
+                               base=RETRY_BASE_DELAY, cap=RETRY_MAX_DELAY, idempotent=True, **kwargs):
+        """POST JSON, retrying 429/5xx and network errors; returns (status, body text, headers)
+        
+        With idempotent=False only 429s and connection failures are retried, since a 5xx or a
+        timeout after the request was sent may still have created the resource.
+        """
+        session = await self._get_aio_session()
+        if idempotent:
+            retry_statuses = RETRYABLE_STATUSES
+            retry_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        else:
+            retry_statuses = NON_IDEMPOTENT_RETRYABLE_STATUSES
+            retry_errors = (aiohttp.ClientConnectorError,)
+        
+        for attempt in range(max_attempts):
+            retry_after = 0.0
+            try:
+                async with session.post(url, json=payload, **kwargs) as response:
+                    status = response.status
+                    headers = response.headers
+                    body = await response.text()
+                    if status in retry_statuses:
+                        retry_after = _retry_after(response)
+            except retry_errors as e:
+                if attempt == max_attempts - 1:
+                    raise
+                logger.warning(f"⚠️ POST {url} failed ({e}), retrying ({attempt + 1}/{max_attempts})")
+            else:
+                if status not in retry_statuses or attempt == max_attempts - 1:
+                    return status, body, headers
+                logger.warning(f"⚠️ POST {url} returned {status}, retrying ({attempt + 1}/{max_attempts})")
+            
+            # Full jitter, with Retry-After as a floor when the server sends one
+            delay = max(retry_after, random.uniform(0, min(cap, base * 2 ** attempt)))
+            await asyncio.sleep(delay)
+    
     async def publish_post(self, post):
         """Publish a post to LinkedIn"""
         try:
+            # Decline like any other failure so the monitor doesn't retry it every poll
+            if not self._configured:
+                raise ValueError("LinkedIn not configured")
+            
             logger.post_activity('publishing', post.draft_id, 'to LinkedIn...')
             
             # Validate post content
@@ -35,43 +164,50 @@ class LinkedInPublisher:
             # Prepare the post data
             post_data = self._prepare_post_data(post)
             
-            # Make the API request
-            response = requests.post(
+            # Make the API request; creating a post is not idempotent, so a lost
+            # response or 5xx is not retried (it could publish a duplicate)
+            status, response_text, response_headers = await self._post_with_retry(
                 f"{self.base_url}/ugcPosts",
-                headers=self._get_headers(),
-                data=json.dumps(post_data)
+                post_data,
+                idempotent=False,
+                headers=self._headers
             )
             
-            if response.status_code == 201:
+            if status == 201:
                 # Success
-                result = response.json()
-                linkedin_post_id = result.get('id')
+                # LinkedIn returns the new URN in a header; only parse the body if it's missing
+                linkedin_post_id = response_headers.get('x-restli-id')
+                if not linkedin_post_id:
+                    linkedin_post_id = json.loads(response_text).get('id')
+                linkedin_url = self._generate_post_url(linkedin_post_id)
                 
                 # Update database
-                db.update_post_status(
-                    post.draft_id, 
+                await asyncio.to_thread(
+                    db.update_post_status,
+                    post.draft_id,
                     PostStatus.POSTED,
                     linkedin_post_id=linkedin_post_id,
-                    linkedin_url=self._generate_post_url(linkedin_post_id)
+                    linkedin_url=linkedin_url
                 )
                 
                 logger.post_activity('published', post.draft_id, f'to LinkedIn (ID: {linkedin_post_id})')
                 
                 # Send webhook notification if configured
-                await self._send_webhook_notification(post, linkedin_post_id)
+                self._send_webhook_notification(post, linkedin_post_id, linkedin_url)
                 
                 return {
                     "success": True,
                     "linkedin_post_id": linkedin_post_id,
-                    "linkedin_url": self._generate_post_url(linkedin_post_id)
+                    "linkedin_url": linkedin_url
                 }
             else:
                 # Error
-                error_message = f"LinkedIn API error: {response.status_code} - {response.text}"
+                error_message = f"LinkedIn API error: {status} - {response_text}"
                 logger.error(error_message)
                 
                 # Update post with error
-                db.update_post_status(
+                await asyncio.to_thread(
+                    db.update_post_status,
                     post.draft_id,
                     PostStatus.DECLINED,
                     last_error=error_message,
@@ -88,7 +224,8 @@ class LinkedInPublisher:
             logger.error(error_message)
             
             # Update post with error
-            db.update_post_status(
+            await asyncio.to_thread(
+                db.update_post_status,
                 post.draft_id,
                 PostStatus.DECLINED,
                 last_error=error_message,
@@ -137,34 +274,24 @@ class LinkedInPublisher:
         return data
     
     def _validate_post(self, post):
-        """Validate post before publishing"""
+        """Validate post content before publishing"""
         errors = []
         
-        if not self.access_token:
-            errors.append("LinkedIn access token not configured")
-        
-        if not self.person_id:
-            errors.append("LinkedIn person ID not configured")
-        
-        if not post.content or not post.content.strip():
+        content = (post.content or "").strip()
+        if not content:
             errors.append("Post content is empty")
-        
-        if len(post.content) > 3000:
+        elif len(post.content) > 3000:
             errors.append("Post content exceeds LinkedIn's 3000 character limit")
         
         return errors
     
     def _generate_post_url(self, linkedin_post_id):
         """Generate a direct URL to the LinkedIn post"""
-        if linkedin_post_id:
-            # Extract numeric ID from URN format
-            if "urn:li:share:" in linkedin_post_id:
-                numeric_id = linkedin_post_id.split(":")[-1]
-                return f"https://www.linkedin.com/posts/activity-{numeric_id}"
-        return None
+        match = _URN_RE.search(linkedin_post_id or '')
+        return f"https://www.linkedin.com/posts/activity-{match.group(1)}" if match else None
     
-    async def _send_webhook_notification(self, post, linkedin_post_id):
-        """Send webhook notification to n8n or other services"""
+    def _send_webhook_notification(self, post, linkedin_post_id, linkedin_url):
+        """Queue a webhook notification for n8n without waiting on the network"""
         if not Config.N8N_WEBHOOK_URL:
             return
         
@@ -173,23 +300,51 @@ class LinkedInPublisher:
                 "event": "linkedin_post_published",
                 "post_id": post.draft_id,
                 "linkedin_post_id": linkedin_post_id,
-                "linkedin_url": self._generate_post_url(linkedin_post_id),
+                "linkedin_url": linkedin_url,
                 "content": post.content,
                 "published_at": datetime.now().isoformat(),
                 "industry": post.industry,
                 "audience": post.audience
             }
             
-            response = requests.post(
+            self._webhook_queue.put_nowait(webhook_data)
+            if self._webhook_task is None or self._webhook_task.done():
+                self._webhook_task = asyncio.create_task(self._webhook_worker())
+                
+        except Exception as e:
+            logger.error(f"Error queueing webhook notification: {e}")
+    
+    async def _webhook_worker(self):
+        """Drain the webhook queue, sending up to WEBHOOK_BATCH_SIZE notifications per POST"""
+        while True:
+            batch = [await self._webhook_queue.get()]
+            try:
+                while len(batch) < WEBHOOK_BATCH_SIZE and batch[-1] is not _WEBHOOK_STOP:
+                    batch.append(self._webhook_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+            
+            stop = batch[-1] is _WEBHOOK_STOP
+            if stop:
+                batch.pop()
+            if batch:
+                await self._send_webhook_batch(batch)
+            if stop:
+                return
+    
+    async def _send_webhook_batch(self, batch):
+        """POST a batch of published-post notifications to n8n"""
+        try:
+            status, _, _ = await self._post_with_retry(
                 Config.N8N_WEBHOOK_URL,
-                json=webhook_data,
-                timeout=10
+                {"event": "linkedin_posts_published_batch", "posts": batch},
+                timeout=aiohttp.ClientTimeout(total=10)
             )
             
-            if response.status_code == 200:
-                logger.info(f"🔔 Webhook notification sent successfully for post {post.draft_id}")
+            if status == 200:
+                logger.info(f"🔔 Webhook notification sent successfully for {len(batch)} post(s)")
             else:
-                logger.warning(f"Webhook notification failed: {response.status_code}")
+                logger.warning(f"Webhook notification failed: {status}")
                 
         except Exception as e:
             logger.error(f"Error sending webhook notification: {e}")
@@ -197,9 +352,8 @@ class LinkedInPublisher:
     def get_profile_info(self):
         """Get LinkedIn profile information"""
         try:
-            response = requests.get(
-                f"{self.base_url}/people/(id:{self.person_id})",
-                headers=self._get_headers()
+            response = self.session.get(
+                f"{self.base_url}/people/(id:{self.person_id})"
             )
             
             if response.status_code == 200:
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, and_, or_, select, text, update
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
@@ -6,6 +6,8 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from enum import Enum
 import datetime
 import uuid
+from typing import Any, NamedTuple, Optional
+from contextlib import contextmanager
 from config import Config
 
 Base = declarative_base()
@@ -18,6 +20,16 @@ class PostStatus(Enum):
 
 class LinkedInDraft(Base):
     __tablename__ = 'linkedin_drafts'
+    __table_args__ = (
+        # Partial indexes matching the get_pending_posts/get_approved_posts filters
+        Index('ix_drafts_pending', 'status',
+              postgresql_where=text("status = 'pending' AND discord_message_id IS NULL")),
+        Index('ix_drafts_approved', 'status',
+              postgresql_where=text("status = 'approved_for_socials' AND linkedin_post_id IS NULL")),
+        Index('ix_drafts_created_at', 'created_at'),
+        Index('ix_drafts_threads', 'golden_threads', postgresql_using='gin',
+              postgresql_ops={'golden_threads': 'jsonb_path_ops'}),
+    )
     
     # Existing fields from your database
     draft_id = Column(Text, primary_key=True)  # Your existing primary key
@@ -43,7 +55,7 @@ class LinkedInDraft(Base):
     # Additional metadata fields (nullable to not break existing data)
     industry = Column(Text)
     audience = Column(Text)
-    golden_threads = Column(Text)  # JSON string of selected themes
+    golden_threads = Column(JSONB)  # Selected themes, stored natively so Postgres can index them
     last_error = Column(Text)
     retry_count = Column(Integer, default=0)
     
@@ -60,25 +72,24 @@ class LinkedInDraft(Base):
         """Get ID from draft_id for compatibility"""
         return self.draft_id
     
+    # (dict key, attribute) pairs for to_dict, in output order
+    _DICT_FIELDS = (
+        ('id', 'draft_id'), ('content', 'post'), ('image_base64', 'image_base64'),
+        ('image_path', 'image_path'), ('status', 'status'), ('created_at', 'created_at'),
+        ('approved_at', 'approved_at'), ('posted_at', 'posted_at'),
+        ('approver_email', 'approver_email'), ('discord_approver', 'discord_approver'),
+        ('industry', 'industry'), ('audience', 'audience'), ('golden_threads', 'golden_threads'),
+        ('linkedin_post_id', 'linkedin_post_id'), ('source', 'source')
+    )
+    _DT_FIELDS = ('created_at', 'approved_at', 'posted_at')
+    
     def to_dict(self):
         """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.draft_id,
-            'content': self.post,
-            'image_base64': self.image_base64,
-            'image_path': self.image_path,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'approved_at': self.approved_at.isoformat() if self.approved_at else None,
-            'posted_at': self.posted_at.isoformat() if self.posted_at else None,
-            'approver_email': self.approver_email,
-            'discord_approver': self.discord_approver,
-            'industry': self.industry,
-            'audience': self.audience,
-            'golden_threads': self.golden_threads,
-            'linkedin_post_id': self.linkedin_post_id,
-            'source': self.source
-        }
+        data = {key: getattr(self, attr) for key, attr in self._DICT_FIELDS}
+        for key in self._DT_FIELDS:
+            value = data[key]
+            data[key] = value.isoformat() if value else None
+        return data
 
 class FormSubmissionStatus(Enum):
     PENDING = "pending"
@@ -104,23 +115,63 @@ class FormSubmission(Base):
     def __repr__(self):
         return f"<FormSubmission(submission_id={self.submission_id}, status={self.status}, created_at={self.created_at})>"
     
+    _DICT_FIELDS = (
+        'submission_id', 'form_data', 'source', 'created_at',
+        'processed_at', 'draft_id', 'status', 'error_message'
+    )
+    _DT_FIELDS = ('created_at', 'processed_at')
+    
     def to_dict(self):
         """Convert model to dictionary for JSON serialization"""
-        return {
-            'submission_id': str(self.submission_id),
-            'form_data': self.form_data,
-            'source': self.source,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'processed_at': self.processed_at.isoformat() if self.processed_at else None,
-            'draft_id': self.draft_id,
-            'status': self.status,
-            'error_message': self.error_message
-        }
+        data = {key: getattr(self, key) for key in self._DICT_FIELDS}
+        data['submission_id'] = str(data['submission_id'])
+        for key in self._DT_FIELDS:
+            value = data[key]
+            data[key] = value.isoformat() if value else None
+        return data
+
+# Columns that status updates may set through **kwargs
+_DRAFT_COLUMNS = frozenset(LinkedInDraft.__table__.columns.keys())
+_SUBMISSION_COLUMNS = frozenset(FormSubmission.__table__.columns.keys())
+
+class QueuedDraft(NamedTuple):
+    """Read-only slice of a draft with just the columns the approval/publish workers read.
+    image_base64 is kept because previews and the publisher fall back to it when image_path is empty."""
+    draft_id: str
+    status: str
+    post: Optional[str]
+    image_path: Optional[str]
+    image_base64: Optional[str]
+    industry: Optional[str]
+    audience: Optional[str]
+    golden_threads: Any
+    created_at: datetime.datetime
+    retry_count: Optional[int]
+    
+    @property
+    def content(self):
+        """Get content from post field, like LinkedInDraft.content"""
+        return self.post
+    
+    @property
+    def id(self):
+        """Get ID from draft_id, like LinkedInDraft.id"""
+        return self.draft_id
+
+_QUEUE_COLUMNS = tuple(getattr(LinkedInDraft, field) for field in QueuedDraft._fields)
 
 class Database:
     def __init__(self):
-        self.engine = create_engine(Config.DATABASE_URL)
-        self.Session = sessionmaker(bind=self.engine)
+        self.engine = create_engine(
+            Config.DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,  # Absorb approval bursts instead of queueing on 5 connections
+            pool_pre_ping=True,  # Detect connections dropped by Postgres before using them
+            pool_recycle=1800,
+            pool_timeout=10
+        )
+        # Objects stay readable after commit/close without a re-fetch
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
     
     def create_tables(self):
         """Create all tables"""
@@ -130,67 +181,138 @@ class Database:
         """Get a new database session"""
         return self.Session()
     
-    def get_pending_posts(self):
-        """Get all pending posts that haven't been sent to Discord"""
-        session = self.get_session()
+    @contextmanager
+    def _session(self, *, commit=False):
+        """Yield a session that is rolled back on error and always closed"""
+        session = self.Session()
         try:
-            return session.query(LinkedInDraft).filter(
-                LinkedInDraft.status == PostStatus.PENDING.value,
-                LinkedInDraft.discord_message_id.is_(None)
-            ).all()
+            yield session
+            if commit:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
     
+    def _queued_drafts(self, *criteria):
+        """Select the QueuedDraft columns of matching drafts"""
+        with self._session() as session:
+            rows = session.execute(select(*_QUEUE_COLUMNS).where(*criteria))
+            return [QueuedDraft(*row) for row in rows]
+    
+    def get_pending_posts(self):
+        """Get all pending posts that haven't been sent to Discord, as QueuedDrafts"""
+        return self._queued_drafts(
+            LinkedInDraft.status == PostStatus.PENDING.value,
+            LinkedInDraft.discord_message_id.is_(None)
+        )
+    
     def get_approved_posts(self):
-        """Get all approved posts that haven't been published"""
-        session = self.get_session()
-        try:
-            return session.query(LinkedInDraft).filter(
+        """Get all approved posts that haven't been published, as QueuedDrafts"""
+        return self._queued_drafts(
+            LinkedInDraft.status == PostStatus.APPROVED_FOR_SOCIALS.value,
+            LinkedInDraft.linkedin_post_id.is_(None)
+        )
+    
+    def count_pending_posts(self):
+        """Count pending posts that haven't been sent to Discord"""
+        with self._session() as session:
+            return session.query(func.count(LinkedInDraft.draft_id)).filter(
+                LinkedInDraft.status == PostStatus.PENDING.value,
+                LinkedInDraft.discord_message_id.is_(None)
+            ).scalar()
+    
+    def count_approved_posts(self):
+        """Count approved posts that haven't been published"""
+        with self._session() as session:
+            return session.query(func.count(LinkedInDraft.draft_id)).filter(
                 LinkedInDraft.status == PostStatus.APPROVED_FOR_SOCIALS.value,
                 LinkedInDraft.linkedin_post_id.is_(None)
-            ).all()
-        finally:
-            session.close()
+            ).scalar()
+    
+    def get_pending_and_approved_posts(self):
+        """Get pending and approved posts (as QueuedDrafts) in a single round-trip"""
+        posts = self._queued_drafts(
+            or_(
+                and_(
+                    LinkedInDraft.status == PostStatus.PENDING.value,
+                    LinkedInDraft.discord_message_id.is_(None)
+                ),
+                and_(
+                    LinkedInDraft.status == PostStatus.APPROVED_FOR_SOCIALS.value,
+                    LinkedInDraft.linkedin_post_id.is_(None)
+                )
+            )
+        )
+        
+        pending = [post for post in posts if post.status == PostStatus.PENDING.value]
+        approved = [post for post in posts if post.status == PostStatus.APPROVED_FOR_SOCIALS.value]
+        return pending, approved
+    
+    @staticmethod
+    def _status_values(status, **fields):
+        """Column values for a status change: status, its timestamp and any known extra fields"""
+        values = {'status': status.value if isinstance(status, PostStatus) else status}
+        
+        # Update timestamp based on status (columns are timezone-aware)
+        if status == PostStatus.APPROVED_FOR_SOCIALS:
+            values['approved_at'] = datetime.datetime.now(datetime.timezone.utc)
+        elif status == PostStatus.POSTED:
+            values['posted_at'] = datetime.datetime.now(datetime.timezone.utc)
+        
+        # Update additional fields
+        values.update((key, value) for key, value in fields.items() if key in _DRAFT_COLUMNS)
+        return values
     
     def update_post_status(self, draft_id, status, **kwargs):
-        """Update post status and related fields"""
-        session = self.get_session()
-        try:
-            post = session.query(LinkedInDraft).filter(LinkedInDraft.draft_id == draft_id).first()
-            if post:
-                post.status = status.value if isinstance(status, PostStatus) else status
-                
-                # Update timestamp based on status
-                if status == PostStatus.APPROVED_FOR_SOCIALS:
-                    post.approved_at = datetime.datetime.now()
-                elif status == PostStatus.POSTED:
-                    post.posted_at = datetime.datetime.now()
-                
-                # Update additional fields
-                for key, value in kwargs.items():
-                    if hasattr(post, key):
-                        setattr(post, key, value)
-                
-                session.commit()
-                return post
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        """Update post status and related fields in a single UPDATE ... RETURNING"""
+        stmt = (
+            update(LinkedInDraft)
+            .where(LinkedInDraft.draft_id == draft_id)
+            .values(**self._status_values(status, **kwargs))
+            .returning(LinkedInDraft)
+        )
+        with self._session(commit=True) as session:
+            return session.execute(stmt).scalar_one_or_none()
     
+    def bulk_update_status(self, draft_ids, status, **kwargs):
+        """Set the same status and fields on many drafts with one UPDATE; returns the row count"""
+        if not draft_ids:
+            return 0
+        
+        stmt = (
+            update(LinkedInDraft)
+            .where(LinkedInDraft.draft_id.in_(draft_ids))
+            .values(**self._status_values(status, **kwargs))
+            .execution_options(synchronize_session=False)
+        )
+        with self._session(commit=True) as session:
+            return session.execute(stmt).rowcount
+
+    def update_post_statuses(self, updates):
+        """Apply many (draft_id, status, fields) updates in one transaction with executemany UPDATEs"""
+        if not updates:
+            return
+
+        # ORM bulk UPDATE by primary key: one executemany per distinct set of columns, one commit
+        rows = [
+            {'draft_id': draft_id, **self._status_values(status, **fields)}
+            for draft_id, status, fields in updates
+        ]
+        with self._session(commit=True) as session:
+            session.execute(update(LinkedInDraft), rows)
+
     def create_post(self, content, **kwargs):
         """Create a new LinkedIn draft record"""
-        import uuid
-        session = self.get_session()
-        try:
-            # Generate a unique draft_id if not provided
-            draft_id = kwargs.pop('draft_id', str(uuid.uuid4()))
-            
-            # Set default source if not provided
-            if 'source' not in kwargs:
-                kwargs['source'] = 'discord-bot'
-            
+        # Generate a unique draft_id if not provided
+        draft_id = kwargs.pop('draft_id', str(uuid.uuid4()))
+        
+        # Set default source if not provided
+        if 'source' not in kwargs:
+            kwargs['source'] = 'discord-bot'
+        
+        with self._session() as session:
             post = LinkedInDraft(
                 draft_id=draft_id,
                 post=content,
@@ -198,19 +320,13 @@ class Database:
                 **kwargs
             )
             session.add(post)
+            # The INSERT's RETURNING fills server defaults (created_at); no refresh SELECT needed
             session.commit()
-            session.refresh(post)
             return post
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
     
     def create_form_submission(self, form_data, source):
         """Create a new form submission record"""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             submission = FormSubmission(
                 form_data=form_data,
                 source=source,
@@ -218,51 +334,34 @@ class Database:
             )
             session.add(submission)
             session.commit()
-            session.refresh(submission)
             return submission
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
     
     def update_form_submission_status(self, submission_id, status, **kwargs):
-        """Update form submission status and related fields"""
-        session = self.get_session()
-        try:
-            submission = session.query(FormSubmission).filter(
-                FormSubmission.submission_id == submission_id
-            ).first()
-            
-            if submission:
-                submission.status = status.value if isinstance(status, FormSubmissionStatus) else status
-                
-                # Update timestamp based on status
-                if status in [FormSubmissionStatus.COMPLETED, FormSubmissionStatus.FAILED]:
-                    submission.processed_at = datetime.datetime.now()
-                
-                # Update additional fields
-                for key, value in kwargs.items():
-                    if hasattr(submission, key):
-                        setattr(submission, key, value)
-                
-                session.commit()
-                return submission
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        """Update form submission status and related fields in a single UPDATE ... RETURNING"""
+        values = {'status': status.value if isinstance(status, FormSubmissionStatus) else status}
+        
+        # Update timestamp based on status
+        if status in [FormSubmissionStatus.COMPLETED, FormSubmissionStatus.FAILED]:
+            values['processed_at'] = datetime.datetime.now(datetime.timezone.utc)
+        
+        # Update additional fields
+        values.update((key, value) for key, value in kwargs.items() if key in _SUBMISSION_COLUMNS)
+        
+        stmt = (
+            update(FormSubmission)
+            .where(FormSubmission.submission_id == submission_id)
+            .values(**values)
+            .returning(FormSubmission)
+        )
+        with self._session(commit=True) as session:
+            return session.execute(stmt).scalar_one_or_none()
     
     def get_pending_form_submissions(self):
         """Get all pending form submissions"""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             return session.query(FormSubmission).filter(
                 FormSubmission.status == FormSubmissionStatus.PENDING.value
             ).all()
-        finally:
-            session.close()
 
 # Global database instance
 db = Database()
\ No newline at end of file
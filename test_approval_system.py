@@ -4,23 +4,24 @@ Test script for the button-based approval system
 Tests the ApprovalView class and button functionality
 """
 
+import asyncio
 import sys
 import os
-import asyncio
 import unittest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, call, patch
 from datetime import datetime
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from discord_linkedin_bot import ApprovalView
+import discord_linkedin_bot
+from discord_linkedin_bot import ApprovalView, LinkedInBot
 from models import PostStatus
 
-class TestApprovalSystem(unittest.TestCase):
+class TestApprovalSystem(unittest.IsolatedAsyncioTestCase):
     """Test the button-based approval system"""
     
-    def setUp(self):
+    async def asyncSetUp(self):
         """Set up test fixtures"""
         self.draft_id = "test-draft-123"
         self.view = ApprovalView(self.draft_id)
@@ -148,21 +149,20 @@ class TestApprovalSystem(unittest.TestCase):
         self.assertIn("Error processing approval", args[0])
         self.assertTrue(kwargs.get('ephemeral', False))
     
-    def test_timeout_handling(self):
+    async def test_timeout_handling(self):
         """Test button timeout functionality"""
         # Simulate timeout
-        self.view.on_timeout()
+        await self.view.on_timeout()
         
         # Check that all buttons are disabled after timeout
         for item in self.view.children:
             self.assertTrue(item.disabled)
 
-class TestButtonSystemIntegration(unittest.TestCase):
+class TestButtonSystemIntegration(unittest.IsolatedAsyncioTestCase):
     """Integration tests for the complete button system"""
     
-    @patch('discord_linkedin_bot.db')
-    @patch('discord_linkedin_bot.linkedin_bot')
-    async def test_full_approval_workflow(self, mock_linkedin_bot, mock_db):
+    @patch('discord_linkedin_bot.queue_status_update', new_callable=AsyncMock)
+    async def test_full_approval_workflow(self, mock_queue_status_update):
         """Test the complete approval workflow"""
         from models import LinkedInDraft
         
@@ -174,21 +174,20 @@ class TestButtonSystemIntegration(unittest.TestCase):
         mock_post.audience = "Tech professionals"
         mock_post.created_at = datetime.now()
         
-        # Mock the linkedin bot setup
-        mock_linkedin_bot.setup_channels = AsyncMock()
-        mock_linkedin_bot.approval_channel = Mock()
-        mock_linkedin_bot.approval_channel.send = AsyncMock()
-        mock_linkedin_bot.create_post_preview_embed = Mock(return_value=Mock())
-        mock_linkedin_bot.create_linkedin_mockup = AsyncMock(return_value=None)
-        
-        mock_db.update_post_status = Mock()
+        # Use a real LinkedInBot with its Discord-facing pieces mocked out
+        linkedin_bot = LinkedInBot()
+        linkedin_bot.approval_channel = Mock()
+        linkedin_bot.approval_channel.id = 456
+        linkedin_bot.approval_channel.send = AsyncMock(return_value=Mock(id=123))
+        linkedin_bot.create_post_preview_embed = Mock(return_value=Mock())
+        linkedin_bot.create_linkedin_mockup = AsyncMock(return_value=None)
         
         # Test sending approval request
-        await mock_linkedin_bot.send_approval_request(mock_post)
+        await linkedin_bot.send_approval_request(mock_post)
         
         # Verify the message was sent with correct components
-        mock_linkedin_bot.approval_channel.send.assert_called_once()
-        call_args = mock_linkedin_bot.approval_channel.send.call_args
+        linkedin_bot.approval_channel.send.assert_called_once()
+        call_args = linkedin_bot.approval_channel.send.call_args
         
         # Check that content includes post ID and full content
         content = call_args[1]['content']
@@ -197,15 +196,84 @@ class TestButtonSystemIntegration(unittest.TestCase):
         
         # Check that view (buttons) was included
         self.assertIn('view', call_args[1])
+        
+        # Check that the Discord message ID is recorded against the draft
+        mock_queue_status_update.assert_awaited_once_with(
+            "workflow-test-123",
+            PostStatus.PENDING,
+            discord_message_id="123",
+            discord_channel_id="456"
+        )
+
+    @patch('discord_linkedin_bot.queue_status_update', new_callable=AsyncMock)
+    async def test_failed_id_write_deletes_approval_message(self, mock_queue_status_update):
+        """Test the sent message is removed when its ID can't be stored, so a resend isn't a duplicate"""
+        mock_queue_status_update.side_effect = Exception("Database error")
+        mock_post = Mock(draft_id="workflow-test-123", content="Test post")
+        message = Mock(id=123, delete=AsyncMock())
+        
+        linkedin_bot = LinkedInBot()
+        linkedin_bot.approval_channel = Mock(id=456, send=AsyncMock(return_value=message))
+        linkedin_bot.create_post_preview_embed = Mock(return_value=Mock())
+        linkedin_bot.create_linkedin_mockup = AsyncMock(return_value=None)
+        
+        await linkedin_bot.send_approval_request(mock_post)
+        
+        message.delete.assert_awaited_once()
 
-def run_async_test(test_func):
-    """Helper to run async test functions"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(test_func())
-    finally:
-        loop.close()
+class TestStatusUpdateWriter(unittest.IsolatedAsyncioTestCase):
+    """Test the queued status update writer"""
+    
+    @patch('discord_linkedin_bot.db')
+    async def test_update_written_directly_without_writer(self, mock_db):
+        """Test an update is written straight away instead of failing when no writer is running"""
+        with patch.object(discord_linkedin_bot.bot, 'status_writer', None):
+            await discord_linkedin_bot.queue_status_update("draft-1", PostStatus.PENDING,
+                                                           discord_message_id="9")
+        
+        mock_db.update_post_status.assert_called_once_with(
+            "draft-1", PostStatus.PENDING, discord_message_id="9"
+        )
+    
+    @patch('discord_linkedin_bot.db')
+    async def test_writer_batches_queued_updates(self, mock_db):
+        """Test waiting updates are written together in a single call, in queue order"""
+        with patch.object(discord_linkedin_bot, '_status_queue', asyncio.Queue()):
+            writer = asyncio.create_task(discord_linkedin_bot.write_status_updates())
+            self.addCleanup(writer.cancel)
+            
+            with patch.object(discord_linkedin_bot.bot, 'status_writer', writer):
+                await asyncio.gather(
+                    discord_linkedin_bot.queue_status_update("draft-1", PostStatus.PENDING,
+                                                             discord_message_id="1"),
+                    discord_linkedin_bot.queue_status_update("draft-2", PostStatus.PENDING,
+                                                             discord_message_id="2"),
+                    discord_linkedin_bot.queue_status_update("draft-3", PostStatus.POSTED)
+                )
+        
+        mock_db.update_post_statuses.assert_called_once_with([
+            ("draft-1", PostStatus.PENDING, {"discord_message_id": "1"}),
+            ("draft-2", PostStatus.PENDING, {"discord_message_id": "2"}),
+            ("draft-3", PostStatus.POSTED, {}),
+        ])
+    
+    @patch('discord_linkedin_bot.db')
+    async def test_failed_batch_fails_every_update(self, mock_db):
+        """Test a failed batch transaction is reported to each waiting caller"""
+        mock_db.update_post_statuses.side_effect = Exception("Database error")
+        with patch.object(discord_linkedin_bot, '_status_queue', asyncio.Queue()):
+            writer = asyncio.create_task(discord_linkedin_bot.write_status_updates())
+            self.addCleanup(writer.cancel)
+            
+            with patch.object(discord_linkedin_bot.bot, 'status_writer', writer):
+                results = await asyncio.gather(
+                    discord_linkedin_bot.queue_status_update("draft-1", PostStatus.POSTED),
+                    discord_linkedin_bot.queue_status_update("draft-2", PostStatus.POSTED),
+                    return_exceptions=True
+                )
+        
+        self.assertTrue(all(isinstance(r, Exception) for r in results))
+        mock_db.update_post_statuses.assert_called_once()
 
 if __name__ == '__main__':
     print("🧪 Testing Button-Based Approval System")
@@ -215,7 +283,7 @@ if __name__ == '__main__':
     suite = unittest.TestSuite()
     
     # Add tests
-    test_classes = [TestApprovalSystem, TestButtonSystemIntegration]
+    test_classes = [TestApprovalSystem, TestButtonSystemIntegration, TestStatusUpdateWriter]
     for test_class in test_classes:
         tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
         suite.addTests(tests)
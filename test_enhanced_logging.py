@@ -8,25 +8,232 @@ color-coded displays with emojis and visual hierarchy.
 
 Run this script to see the enhanced logging system in action:
     python test_enhanced_logging.py
+
+Set DEMO_FAST=1 (or DEMO_SLEEP_SCALE=0) to skip all pauses (e.g. for CI smoke runs).
+Set LOGLEVEL (e.g. LOGLEVEL=ERROR) to raise the demo loggers' threshold; with INFO
+disabled the INFO-only sections and all pauses are skipped.
 """
 
+import atexit
+import io
+import logging
+import os
+import queue
+import sys
 import time
-import random
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
 from enhanced_logging import get_enhanced_logger, setup_enhanced_logging, check_dependencies
 
+# Multiplier for the demo's pauses; 0 disables them entirely
+_DEMO_SLEEP = 0.0 if os.getenv('DEMO_FAST') else float(os.getenv('DEMO_SLEEP_SCALE', '1.0'))
+
+# Loggers the demo routes through the queue and sets LOGLEVEL on
+_DEMO_LOGGERS = (__name__, 'discord_linkedin_bot', 'linkedin_publisher', 'db_monitor', '__main__', 'custom_component')
+
+# Banner pieces, built once; each section header carries its rule
+_BAR80 = "=" * 80
+_RULE50 = "-" * 50
+_SECTIONS = tuple(f"\n📋 {i}. {name}\n{_RULE50}\n" for i, name in enumerate((
+    "STARTUP BANNER DEMONSTRATION",
+    "CONNECTION STATUS DEMONSTRATION",
+    "API CALL LOGGING DEMONSTRATION",
+    "POST ACTIVITY TRACKING DEMONSTRATION",
+    "SYSTEM HEALTH MONITORING DEMONSTRATION",
+    "PROGRESS UPDATES DEMONSTRATION",
+    "STANDARD LOG LEVELS DEMONSTRATION",
+    "MESSAGE ENHANCEMENT DEMONSTRATION",
+    "ERROR HANDLING AND VISUAL SEPARATORS",
+    "COMPONENT-SPECIFIC STYLING DEMONSTRATION",
+), 1))
+
+# Opening and closing banners, encoded once and written straight to fd 1
+_STDOUT_ENCODING = sys.stdout.encoding or 'utf-8'
+_HEADER_BYTES = f"{_BAR80}\n🎯 ENHANCED LOGGING SYSTEM - FEATURE DEMONSTRATION\n{_BAR80}\n\n".encode(_STDOUT_ENCODING)
+_FOOTER_BYTES = f"\n{_BAR80}\n🎉 ENHANCED LOGGING DEMONSTRATION COMPLETE\n{_BAR80}\n".encode(_STDOUT_ENCODING)
+
+# Demo data, shared across runs
+_SERVICES = (
+    ("Discord API", True, "Connected as TestBot#1234"),
+    ("LinkedIn API", True, "Profile access confirmed"),
+    ("PostgreSQL Database", True, "Connection pool: 5/10 active"),
+    ("Redis Cache", False, "Connection timeout after 5s"),
+    ("External Webhook", True, "Response time: 0.23s"),
+)
+
+_API_CALLS = (
+    ("LinkedIn", "/v2/people/~", 200, 0.45),
+    ("Discord", "/api/v9/gateway", 200, 0.23),
+    ("LinkedIn", "/v2/ugcPosts", 201, 0.78),
+    ("Discord", "/api/v9/channels/123/messages", 429, 1.20),
+    ("External API", "/webhook/notify", 500, 5.67),
+)
+
+# One table row per API call; failures are marked per row
+_API_FMT = "{mark} {svc:<12} {ep:<32} {code:>3} {rt:>5.2f}s"
+
+def _api_level(code):
+    """Level api_call logs a status code at: 2xx INFO, 4xx WARNING, anything else ERROR"""
+    if 200 <= code < 300:
+        return logging.INFO
+    return logging.WARNING if 400 <= code < 500 else logging.ERROR
+
+# The table is one record, logged at its worst row's level so failures survive LOGLEVEL filtering
+_API_LEVEL = max(_api_level(code) for _, _, code, _ in _API_CALLS)
+
+_POST_ACTIVITIES = (
+    ('created', 'draft_abc123', 'from webhook form submission'),
+    ('approved', 'draft_abc123', 'by UserModerator#5678'),
+    ('published', 'draft_abc123', 'to LinkedIn (ID: urn:li:share:123456789)'),
+    ('created', 'draft_xyz789', 'from Discord slash command'),
+    ('rejected', 'draft_xyz789', 'inappropriate content detected'),
+    ('edited', 'draft_def456', 'content updated by admin'),
+    ('deleted', 'draft_old999', 'cleanup of old drafts'),
+)
+
+_HEALTH_CHECKS = (
+    ('Database Monitor', 'healthy', MappingProxyType({'polls': 1500, 'errors': 0, 'uptime': '24h'})),
+    ('Discord Bot', 'healthy', MappingProxyType({'guilds': 5, 'users': 250, 'commands': 12})),
+    ('LinkedIn Publisher', 'warning', MappingProxyType({'rate_limit': '80%', 'queue': 15})),
+    ('Memory Usage', 'warning', MappingProxyType({'used': '85%', 'available': '1.2GB'})),
+    ('Disk Space', 'critical', MappingProxyType({'free': '2%', 'total': '100GB'})),
+    ('API Gateway', 'healthy', MappingProxyType({'response_time': '0.45s', 'success_rate': '99.8%'})),
+)
+
+_LOG_EXAMPLES = (
+    ("debug", "Detailed debugging information for troubleshooting"),
+    ("info", "General information about system operation"),
+    ("warning", "Something unexpected happened but system continues"),
+    ("error", "Serious problem occurred, some functionality may be affected"),
+    ("critical", "Very serious error, system may be unable to continue"),
+)
+
+_ENHANCED_MESSAGES = (
+    "Discord connection established with 250 users online",
+    "LinkedIn API responded with status 200 in 0.45 seconds",
+    "Post post_abc123 was successfully published to LinkedIn",
+    "Database query failed after 5.2 seconds with error code 1062",
+    "Processing 15 draft_submissions with total size of 2.5MB",
+    "User approval_request_789 connected from IP 192.168.1.100",
+)
+
+_SUMMARY = (
+    "All enhanced logging features demonstrated successfully!",
+    "The system provides:",
+    "✅ Color-coded log levels with emojis",
+    "✅ Component-specific styling and emojis",
+    "✅ Enhanced message formatting with keyword highlighting",
+    "✅ Specialized logging methods for common operations",
+    "✅ Visual progress indicators and status displays",
+    "✅ Automatic CI/CD compatibility with plain text fallback",
+    "✅ Professional startup banners and visual separators",
+)
+
+# Logger names rather than loggers, resolved in main() once logging is set up
+_COMPONENTS = (
+    ('discord_linkedin_bot', "Discord bot ready for commands"),
+    ('linkedin_publisher', "LinkedIn API client initialized"),
+    ('db_monitor', "Database monitoring started"),
+    ('__main__', "Main application process launched"),
+    ('custom_component', "Custom component with default styling"),
+)
+
+def _sleep(seconds):
+    """Pause between demo sections, scaled by DEMO_SLEEP_SCALE"""
+    if _DEMO_SLEEP:
+        time.sleep(seconds * _DEMO_SLEEP)
+
+def paced(items, interval):
+    """Yield items one interval apart on a single monotonic schedule"""
+    interval *= _DEMO_SLEEP
+    deadline = time.monotonic()
+    for item in items:
+        yield item
+        if interval:
+            deadline += interval
+            time.sleep(max(0, deadline - time.monotonic()))
+
+@lru_cache(maxsize=1)
+def _buffer_stdout():
+    """Swap sys.stdout for a 64 KB buffered writer; flushed and restored at exit"""
+    original = sys.stdout
+    original.flush()
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(original.buffer, buffer_size=65536),
+        encoding=original.encoding,
+        errors=original.errors,
+        write_through=False,
+        line_buffering=False
+    )
+    
+    def restore():
+        sys.stdout.flush()
+        # Detach rather than close so the real stdout stays open
+        sys.stdout.detach().detach()
+        sys.stdout = original
+    
+    atexit.register(restore)
+
+# Log records from the demo are queued and written by a QueueListener thread
+_log_queue = queue.Queue()
+
+def _queue_logging(names):
+    """Send the root and demo loggers through one QueueHandler; start the listener"""
+    root_logger = logging.getLogger()
+    targets = root_logger.handlers[:]
+    queue_handler = QueueHandler(_log_queue)
+    
+    for logger in [root_logger] + [get_enhanced_logger(name).logger for name in names]:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+    
+    listener = QueueListener(_log_queue, *targets, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+    return listener
+
+def _print(*args):
+    """print() once queued log records are written, so banners stay in order"""
+    _log_queue.join()
+    print(*args)
+
+@lru_cache(maxsize=1)
+def _ensure_setup():
+    """Check dependencies and install demo logging once, however often main() runs"""
+    check_dependencies()
+    setup_enhanced_logging()
+    _queue_logging(_DEMO_LOGGERS)
+    
+    level = os.getenv('LOGLEVEL')
+    if level:
+        for name in _DEMO_LOGGERS:
+            get_enhanced_logger(name).logger.setLevel(level.upper())
+
+def _raw(data):
+    """Write pre-encoded bytes to fd 1 after everything already queued or buffered"""
+    _log_queue.join()
+    sys.stdout.flush()
+    os.write(1, data)
+
+def _section(number):
+    """Write a numbered section header and rule in one write, then flush"""
+    _log_queue.join()
+    sys.stdout.write(_SECTIONS[number - 1])
+    sys.stdout.flush()
+
 def main():
     """Demonstrate all enhanced logging features"""
+    global _DEMO_SLEEP
     
-    print("=" * 80)
-    print("🎯 ENHANCED LOGGING SYSTEM - FEATURE DEMONSTRATION")
-    print("=" * 80)
-    print()
+    # Before setup_enhanced_logging so its handler writes to the buffered stream
+    _buffer_stdout()
     
-    # Check dependencies first
-    check_dependencies()
+    _raw(_HEADER_BYTES)
     
-    # Setup enhanced logging system-wide
-    setup_enhanced_logging()
+    # Check dependencies and setup enhanced logging system-wide
+    _ensure_setup()
     
     # Get enhanced loggers for different components
     main_logger = get_enhanced_logger(__name__)
@@ -34,176 +241,104 @@ def main():
     linkedin_logger = get_enhanced_logger('linkedin_publisher')
     db_logger = get_enhanced_logger('db_monitor')
     
-    # 1. STARTUP BANNER DEMONSTRATION
-    print("\n📋 1. STARTUP BANNER DEMONSTRATION")
-    print("-" * 50)
-    main_logger.startup_banner("Enhanced Logging Demo", "v2.0")
+    # With INFO off there is little to show: skip INFO-only sections and every pause
+    INFO_ON = main_logger.logger.isEnabledFor(logging.INFO)
+    if not INFO_ON:
+        _DEMO_SLEEP = 0.0
     
-    time.sleep(2)
+    # 1. STARTUP BANNER DEMONSTRATION
+    if INFO_ON:
+        _section(1)
+        main_logger.startup_banner("Enhanced Logging Demo", "v2.0")
+        
+        _sleep(2)
     
     # 2. CONNECTION STATUS DEMONSTRATION
-    print("\n📋 2. CONNECTION STATUS DEMONSTRATION")
-    print("-" * 50)
-    
-    services = [
-        ("Discord API", True, "Connected as TestBot#1234"),
-        ("LinkedIn API", True, "Profile access confirmed"),
-        ("PostgreSQL Database", True, "Connection pool: 5/10 active"),
-        ("Redis Cache", False, "Connection timeout after 5s"),
-        ("External Webhook", True, "Response time: 0.23s")
-    ]
-    
-    for service, status, details in services:
+    _section(2)
+    
+    for service, status, details in paced(_SERVICES, 0.5):
         discord_logger.connection_status(service, status, details)
-        time.sleep(0.5)
     
     # 3. API CALL LOGGING DEMONSTRATION
-    print("\n📋 3. API CALL LOGGING DEMONSTRATION")
-    print("-" * 50)
-    
-    api_calls = [
-        ("LinkedIn", "/v2/people/~", 200, 0.45),
-        ("Discord", "/api/v9/gateway", 200, 0.23),
-        ("LinkedIn", "/v2/ugcPosts", 201, 0.78),
-        ("Discord", "/api/v9/channels/123/messages", 429, 1.20),
-        ("External API", "/webhook/notify", 500, 5.67)
-    ]
-    
-    for service, endpoint, status_code, response_time in api_calls:
-        linkedin_logger.api_call(service, endpoint, status_code, response_time)
-        time.sleep(0.3)
+    # The table is a single record at _API_LEVEL; show the section whenever it is emitted
+    if linkedin_logger.logger.isEnabledFor(_API_LEVEL):
+        _section(3)
+        
+        api_lines = [
+            _API_FMT.format(mark="✅" if 200 <= code < 300 else "❌", svc=svc, ep=ep, code=code, rt=rt)
+            for svc, ep, code, rt in _API_CALLS
+        ]
+        linkedin_logger.log_batch(_API_LEVEL, "API calls:", api_lines)
     
     # 4. POST ACTIVITY TRACKING DEMONSTRATION
-    print("\n📋 4. POST ACTIVITY TRACKING DEMONSTRATION")
-    print("-" * 50)
-    
-    post_activities = [
-        ('created', 'draft_abc123', 'from webhook form submission'),
-        ('approved', 'draft_abc123', 'by UserModerator#5678'),
-        ('published', 'draft_abc123', 'to LinkedIn (ID: urn:li:share:123456789)'),
-        ('created', 'draft_xyz789', 'from Discord slash command'),
-        ('rejected', 'draft_xyz789', 'inappropriate content detected'),
-        ('edited', 'draft_def456', 'content updated by admin'),
-        ('deleted', 'draft_old999', 'cleanup of old drafts')
-    ]
-    
-    for action, post_id, details in post_activities:
-        discord_logger.post_activity(action, post_id, details)
-        time.sleep(0.4)
+    if INFO_ON:
+        _section(4)
+        
+        for action, post_id, details in paced(_POST_ACTIVITIES, 0.4):
+            discord_logger.post_activity(action, post_id, details)
     
     # 5. SYSTEM HEALTH MONITORING DEMONSTRATION
-    print("\n📋 5. SYSTEM HEALTH MONITORING DEMONSTRATION")
-    print("-" * 50)
-    
-    health_checks = [
-        ('Database Monitor', 'healthy', {'polls': 1500, 'errors': 0, 'uptime': '24h'}),
-        ('Discord Bot', 'healthy', {'guilds': 5, 'users': 250, 'commands': 12}),
-        ('LinkedIn Publisher', 'warning', {'rate_limit': '80%', 'queue': 15}),
-        ('Memory Usage', 'warning', {'used': '85%', 'available': '1.2GB'}),
-        ('Disk Space', 'critical', {'free': '2%', 'total': '100GB'}),
-        ('API Gateway', 'healthy', {'response_time': '0.45s', 'success_rate': '99.8%'})
-    ]
-    
-    for component, status, metrics in health_checks:
+    _section(5)
+    
+    for component, status, metrics in paced(_HEALTH_CHECKS, 0.4):
         db_logger.system_health(component, status, metrics)
-        time.sleep(0.4)
     
     # 6. PROGRESS UPDATES DEMONSTRATION
-    print("\n📋 6. PROGRESS UPDATES DEMONSTRATION")
-    print("-" * 50)
-    
-    # Simulate batch processing
-    total_posts = 50
-    for i in range(0, total_posts + 1, 5):
-        main_logger.progress_update("Processing LinkedIn posts", i, total_posts)
-        time.sleep(0.2)
-    
-    print()
-    
-    # Simulate file upload
-    total_files = 25
-    for i in range(0, total_files + 1, 3):
-        linkedin_logger.progress_update("Uploading media files", i, total_files)
-        time.sleep(0.15)
+    if INFO_ON:
+        _section(6)
+        
+        # Simulate batch processing
+        main_logger.progress_range("Processing LinkedIn posts", 50, 5, 0.2 * _DEMO_SLEEP)
+        
+        _print()
+        
+        # Simulate file upload
+        linkedin_logger.progress_range("Uploading media files", 25, 3, 0.15 * _DEMO_SLEEP)
     
     # 7. STANDARD LOG LEVELS DEMONSTRATION
-    print("\n📋 7. STANDARD LOG LEVELS DEMONSTRATION")
-    print("-" * 50)
-    
-    log_examples = [
-        ("debug", "Detailed debugging information for troubleshooting"),
-        ("info", "General information about system operation"),
-        ("warning", "Something unexpected happened but system continues"),
-        ("error", "Serious problem occurred, some functionality may be affected"),
-        ("critical", "Very serious error, system may be unable to continue")
-    ]
+    _section(7)
     
-    for level, message in log_examples:
-        getattr(main_logger, level)(f"{message}")
-        time.sleep(0.4)
+    # Bind each level's method once, leaving out levels below the logger's threshold
+    log_examples = tuple(
+        (getattr(main_logger, level), message)
+        for level, message in _LOG_EXAMPLES
+        if main_logger.logger.isEnabledFor(getattr(logging, level.upper()))
+    )
+    for log, message in paced(log_examples, 0.4):
+        log("%s", message)
     
     # 8. MESSAGE ENHANCEMENT DEMONSTRATION
-    print("\n📋 8. MESSAGE ENHANCEMENT DEMONSTRATION")
-    print("-" * 50)
-    
-    enhanced_messages = [
-        "Discord connection established with 250 users online",
-        "LinkedIn API responded with status 200 in 0.45 seconds",
-        "Post post_abc123 was successfully published to LinkedIn",
-        "Database query failed after 5.2 seconds with error code 1062",
-        "Processing 15 draft_submissions with total size of 2.5MB",
-        "User approval_request_789 connected from IP 192.168.1.100"
-    ]
-    
-    for message in enhanced_messages:
-        main_logger.info(message)
-        time.sleep(0.5)
+    if INFO_ON:
+        _section(8)
+        
+        main_logger.log_batch(logging.INFO, "Sample messages:", _ENHANCED_MESSAGES)
     
     # 9. ERROR HANDLING DEMONSTRATION
-    print("\n📋 9. ERROR HANDLING AND VISUAL SEPARATORS")
-    print("-" * 50)
+    _section(9)
     
     # Show how errors and critical messages get visual separators
     main_logger.error("Database connection pool exhausted - no available connections")
-    time.sleep(1)
+    _sleep(1)
     main_logger.critical("LinkedIn API rate limit exceeded - publishing suspended")
-    time.sleep(1)
+    _sleep(1)
     
     # 10. COMPONENT-SPECIFIC STYLING DEMONSTRATION
-    print("\n📋 10. COMPONENT-SPECIFIC STYLING DEMONSTRATION")
-    print("-" * 50)
-    
-    # Show how different components get different styling
-    components = [
-        (get_enhanced_logger('discord_linkedin_bot'), "Discord bot ready for commands"),
-        (get_enhanced_logger('linkedin_publisher'), "LinkedIn API client initialized"),
-        (get_enhanced_logger('db_monitor'), "Database monitoring started"),
-        (get_enhanced_logger('__main__'), "Main application process launched"),
-        (get_enhanced_logger('custom_component'), "Custom component with default styling")
-    ]
-    
-    for logger, message in components:
-        logger.info(message)
-        time.sleep(0.4)
+    if INFO_ON:
+        _section(10)
+        
+        # Show how different components get different styling
+        for name, message in paced(_COMPONENTS, 0.4):
+            get_enhanced_logger(name).info(message)
     
     # FINAL SUMMARY
-    print("\n" + "=" * 80)
-    print("🎉 ENHANCED LOGGING DEMONSTRATION COMPLETE")
-    print("=" * 80)
-    
-    main_logger.info("All enhanced logging features demonstrated successfully!")
-    main_logger.info("The system provides:")
-    main_logger.info("✅ Color-coded log levels with emojis")
-    main_logger.info("✅ Component-specific styling and emojis") 
-    main_logger.info("✅ Enhanced message formatting with keyword highlighting")
-    main_logger.info("✅ Specialized logging methods for common operations")
-    main_logger.info("✅ Visual progress indicators and status displays")
-    main_logger.info("✅ Automatic CI/CD compatibility with plain text fallback")
-    main_logger.info("✅ Professional startup banners and visual separators")
-    
-    print("\n💡 TIP: Set NO_COLOR=1 environment variable to see plain text fallback")
-    print("💡 TIP: Run in CI/CD environment to see automatic color detection")
-    print()
+    _raw(_FOOTER_BYTES)
+    
+    if INFO_ON:
+        main_logger.log_batch(logging.INFO, _SUMMARY[0], _SUMMARY[1:])
+    
+    _print("\n💡 TIP: Set NO_COLOR=1 environment variable to see plain text fallback")
+    _print("💡 TIP: Run in CI/CD environment to see automatic color detection")
+    _print()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
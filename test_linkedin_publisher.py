@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test script for LinkedInPublisher HTTP handling
+Tests the retry/backoff policy around LinkedIn and n8n POSTs
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
+
+import aiohttp
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from linkedin_publisher import LinkedInPublisher
+
+def make_response(status, body="", headers=None):
+    """Build an async-context-manager response like aiohttp's"""
+    response = Mock()
+    response.status = status
+    response.headers = headers or {}
+    response.text = AsyncMock(return_value=body)
+
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context
+
+class TestPostWithRetry(unittest.IsolatedAsyncioTestCase):
+    """Test the exponential-backoff retry helper"""
+
+    def setUp(self):
+        self.publisher = LinkedInPublisher()
+        self.session = Mock()
+        self.publisher._get_aio_session = AsyncMock(return_value=self.session)
+
+        sleep_patcher = patch('linkedin_publisher.asyncio.sleep', new_callable=AsyncMock)
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    async def test_success_is_not_retried(self):
+        """Test a 201 is returned straight away"""
+        self.session.post.side_effect = [make_response(201, '{"id": "urn:li:share:1"}')]
+
+        status, body, _ = await self.publisher._post_with_retry("https://example.com", {})
+
+        self.assertEqual(status, 201)
+        self.assertEqual(body, '{"id": "urn:li:share:1"}')
+        self.sleep.assert_not_awaited()
+
+    async def test_transient_status_is_retried(self):
+        """Test 429/5xx are retried and Retry-After is used as a floor"""
+        self.session.post.side_effect = [
+            make_response(429, headers={'Retry-After': '5'}),
+            make_response(503),
+            make_response(201, '{}'),
+        ]
+
+        status, _, _ = await self.publisher._post_with_retry("https://example.com", {}, cap=2.0)
+
+        self.assertEqual(status, 201)
+        self.assertEqual(self.session.post.call_count, 3)
+        self.assertGreaterEqual(self.sleep.await_args_list[0].args[0], 5)
+        self.assertLessEqual(self.sleep.await_args_list[1].args[0], 2.0)
+
+    async def test_client_errors_are_not_retried(self):
+        """Test a 4xx other than 429 is returned without retrying"""
+        self.session.post.side_effect = [make_response(400, "bad request")]
+
+        status, body, _ = await self.publisher._post_with_retry("https://example.com", {})
+
+        self.assertEqual((status, body), (400, "bad request"))
+        self.assertEqual(self.session.post.call_count, 1)
+
+    async def test_exhausted_retries(self):
+        """Test the last status is returned and network errors re-raise once retries run out"""
+        self.session.post.side_effect = [make_response(502), make_response(502), make_response(502)]
+        status, _, _ = await self.publisher._post_with_retry("https://example.com", {})
+        self.assertEqual(status, 502)
+        self.assertEqual(self.sleep.await_count, 2)
+
+        self.session.post.side_effect = aiohttp.ClientConnectionError("down")
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await self.publisher._post_with_retry("https://example.com", {}, max_attempts=2)
+
+    async def test_non_idempotent_post_is_not_resent_after_send(self):
+        """Test a timeout or 5xx after the request was sent does not POST again"""
+        self.session.post.side_effect = asyncio.TimeoutError()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.publisher._post_with_retry("https://example.com", {}, idempotent=False)
+        self.assertEqual(self.session.post.call_count, 1)
+
+        self.session.post.reset_mock()
+        self.session.post.side_effect = [make_response(503), make_response(201)]
+        status, _, _ = await self.publisher._post_with_retry("https://example.com", {}, idempotent=False)
+        self.assertEqual(status, 503)
+        self.assertEqual(self.session.post.call_count, 1)
+
+    async def test_non_idempotent_post_retries_429_and_connect_errors(self):
+        """Test requests LinkedIn never acted on are still retried"""
+        connect_error = aiohttp.ClientConnectorError(Mock(host="example.com", port=443, ssl=True),
+                                                     OSError("refused"))
+        self.session.post.side_effect = [connect_error, make_response(429), make_response(201)]
+
+        status, _, _ = await self.publisher._post_with_retry("https://example.com", {}, idempotent=False)
+
+        self.assertEqual(status, 201)
+        self.assertEqual(self.session.post.call_count, 3)
+
+class TestPublishPost(unittest.IsolatedAsyncioTestCase):
+    """Test publish_post's handling of the ugcPosts response"""
+
+    def setUp(self):
+        self.publisher = LinkedInPublisher()
+        self.publisher._configured = True
+        self.post = Mock(draft_id="draft-1", content="Hello LinkedIn", image_path=None,
+                         image_base64=None, retry_count=0)
+
+        db_patcher = patch('linkedin_publisher.db')
+        self.db = db_patcher.start()
+        self.addCleanup(db_patcher.stop)
+
+    async def test_post_id_read_from_restli_header(self):
+        """Test the URN comes from x-restli-id without parsing the body"""
+        self.publisher._post_with_retry = AsyncMock(
+            return_value=(201, "not json", {'x-restli-id': 'urn:li:share:42'})
+        )
+
+        result = await self.publisher.publish_post(self.post)
+
+        self.assertEqual(result["linkedin_post_id"], 'urn:li:share:42')
+        self.assertEqual(result["linkedin_url"], "https://www.linkedin.com/posts/activity-42")
+
+    async def test_post_id_falls_back_to_body(self):
+        """Test the URN is read from the JSON body when the header is missing"""
+        self.publisher._post_with_retry = AsyncMock(
+            return_value=(201, '{"id": "urn:li:share:7"}', {})
+        )
+
+        result = await self.publisher.publish_post(self.post)
+
+        self.assertEqual(result["linkedin_post_id"], 'urn:li:share:7')
+
+    async def test_status_written_off_the_event_loop(self):
+        """Test the POSTED update runs in a worker thread so concurrent publishes aren't stalled"""
+        self.publisher._post_with_retry = AsyncMock(
+            return_value=(201, "", {'x-restli-id': 'urn:li:share:42'})
+        )
+        threads = []
+        self.db.update_post_status.side_effect = lambda *a, **kw: threads.append(threading.current_thread())
+
+        await self.publisher.publish_post(self.post)
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    async def test_timeout_after_send_publishes_once(self):
+        """Test a ugcPosts timeout fails the publish instead of POSTing a duplicate"""
+        session = Mock()
+        session.post.side_effect = asyncio.TimeoutError()
+        self.publisher._get_aio_session = AsyncMock(return_value=session)
+
+        with patch('linkedin_publisher.asyncio.sleep', new_callable=AsyncMock):
+            result = await self.publisher.publish_post(self.post)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(session.post.call_count, 1)
+
+class TestWebhookShutdown(unittest.IsolatedAsyncioTestCase):
+    """Test close() delivers every queued publish notification"""
+
+    async def test_close_finishes_in_flight_batch(self):
+        """Test the batch being POSTed when close() is called is still sent, then the rest"""
+        publisher = LinkedInPublisher()
+        sending = asyncio.Event()
+        release = asyncio.Event()
+        sent = []
+
+        async def send_batch(batch):
+            sending.set()
+            await release.wait()
+            sent.append(list(batch))
+
+        publisher._send_webhook_batch = send_batch
+        with patch('linkedin_publisher.Config', Mock(N8N_WEBHOOK_URL='https://n8n.example/hook')):
+            publisher._send_webhook_notification(Mock(draft_id="a"), "urn:li:share:1", None)
+            await sending.wait()
+            publisher._send_webhook_notification(Mock(draft_id="b"), "urn:li:share:2", None)
+
+            closing = asyncio.create_task(publisher.close())
+            await asyncio.sleep(0)
+            release.set()
+            await closing
+
+        self.assertEqual([[n["post_id"] for n in batch] for batch in sent], [["a"], ["b"]])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
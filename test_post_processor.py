@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for PostProcessor content analysis
+Tests hashtag/mention extraction and the engagement heuristic
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from db_monitor import PostProcessor, _cached_preview
+
+def make_post(content, industry=None, image_path=None, image_base64=None):
+    """Build a minimal post object for PostProcessor"""
+    post = Mock()
+    post.content = content
+    post.industry = industry
+    post.image_path = image_path
+    post.image_base64 = image_base64
+    return post
+
+class TestPostProcessor(unittest.TestCase):
+    """Test PostProcessor scanning and preview building"""
+
+    def test_scan_content_collects_everything_in_one_pass(self):
+        """Test that one scan finds hashtags, mentions and signals"""
+        scan = PostProcessor.scan_content("My damn take on #Data with @alice? #AI")
+
+        self.assertEqual(scan.hashtags, ['#Data', '#AI'])
+        self.assertEqual(scan.mentions, ['@alice'])
+        self.assertEqual(scan.profanity, ['damn'])
+        self.assertTrue(scan.has_question)
+        self.assertTrue(scan.has_personal)
+
+    def test_scan_matches_standalone_extractors(self):
+        """Test that the fused scan agrees with extract_hashtags/extract_mentions"""
+        content = "Ping @bob and @carol about #roadmap, #q3 and email a@b.com"
+        scan = PostProcessor.scan_content(content)
+
+        self.assertEqual(scan.hashtags, PostProcessor.extract_hashtags(content))
+        self.assertEqual(scan.mentions, PostProcessor.extract_mentions(content))
+
+    def test_personal_indicators_respect_word_boundaries(self):
+        """Test that words like 'time' or 'hi' are not personal indicators"""
+        scan = PostProcessor.scan_content("Say hi, it is time to ship")
+        self.assertFalse(scan.has_personal)
+
+        scan = PostProcessor.scan_content("PERSONALLY, this changed everything")
+        self.assertTrue(scan.has_personal)
+
+    def test_create_linkedin_preview(self):
+        """Test preview fields are populated from a single scan"""
+        post = make_post("I shipped it #launch " + "x" * 600, industry="Tech")
+        preview = PostProcessor.create_linkedin_preview(post)
+
+        self.assertEqual(len(preview["content"]), 500)
+        self.assertTrue(preview["content"].endswith("..."))
+        self.assertEqual(preview["character_count"], len(post.content))
+        self.assertEqual(preview["hashtags"], ['#launch'])
+        self.assertEqual(preview["mentions"], [])
+        self.assertFalse(preview["has_image"])
+
+    def test_create_linkedin_preview_is_cached(self):
+        """Test re-rendering the same post reuses the cached preview"""
+        post = make_post("Cache me #once", industry="Tech")
+        first = PostProcessor.create_linkedin_preview(post)
+        hits = _cached_preview.cache_info().hits
+
+        second = PostProcessor.create_linkedin_preview(post)
+        self.assertEqual(_cached_preview.cache_info().hits, hits + 1)
+        self.assertEqual(first, second)
+
+        post.image_path = "img.png"
+        self.assertTrue(PostProcessor.create_linkedin_preview(post)["has_image"])
+
+    def test_mutating_a_preview_leaves_the_cache_intact(self):
+        """Test callers get their own hashtag/mention lists, not the cached ones"""
+        post = make_post("Mutate me #tag @someone", industry="Tech")
+        first = PostProcessor.create_linkedin_preview(post)
+        first["hashtags"].append("#extra")
+        first["mentions"].clear()
+
+        second = PostProcessor.create_linkedin_preview(post)
+        self.assertEqual(second["hashtags"], ["#tag"])
+        self.assertEqual(second["mentions"], ["@someone"])
+
+    def test_estimate_engagement_levels(self):
+        """Test engagement buckets for low and high scoring posts"""
+        self.assertEqual(PostProcessor.estimate_engagement(make_post("Short post")), "Low")
+
+        words = " ".join(["word"] * 30)
+        high = make_post(f"In my experience {words}?", industry="Tech", image_path="img.png")
+        self.assertEqual(PostProcessor.estimate_engagement(high), "High")
+
+    def test_validate_post_content_profanity(self):
+        """Test profanity is matched case-insensitively on word boundaries"""
+        errors = PostProcessor.validate_post_content("Damn, that was a damn good quarter")
+        self.assertEqual(errors, ["Content contains inappropriate language: damn"])
+
+        self.assertEqual(PostProcessor.validate_post_content("A lesson on damnation"), [])
+
+    def test_validate_post_content_profanity_in_hashtags_and_mentions(self):
+        """Test profanity inside a hashtag or mention is still flagged"""
+        self.assertEqual(PostProcessor.validate_post_content("this is #shit content"),
+                         ["Content contains inappropriate language: shit"])
+        self.assertEqual(PostProcessor.validate_post_content("@damn hi"),
+                         ["Content contains inappropriate language: damn"])
+
+    def test_scan_and_standalone_engagement_agree_on_tagged_words(self):
+        """Test personal words inside hashtags count the same on both engagement paths"""
+        post = make_post("Sharing #my story with @me")
+        scan = PostProcessor.scan_content(post.content)
+
+        self.assertTrue(scan.has_personal)
+        self.assertEqual(PostProcessor.estimate_engagement(post, scan),
+                         PostProcessor.estimate_engagement(post))
+
+    def test_scan_keeps_unicode_hashtags_and_mentions_whole(self):
+        """Test non-ASCII word characters stay part of hashtags and mentions"""
+        scan = PostProcessor.scan_content("Coffee at the #café with @José")
+
+        self.assertEqual(scan.hashtags, ["#café"])
+        self.assertEqual(scan.mentions, ["@José"])
+
+    def test_validate_post_content_oversize_stops_early(self):
+        """Test oversize content only reports the length error"""
+        errors = PostProcessor.validate_post_content("damn " * 700)
+        self.assertEqual(errors, ["Content exceeds LinkedIn's 3000 character limit"])
+
+    def test_validate_post_content_empty(self):
+        """Test empty and whitespace-only content is rejected"""
+        for content in ("", "   \n\t", None):
+            self.assertEqual(PostProcessor.validate_post_content(content), ["Content cannot be empty"])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)